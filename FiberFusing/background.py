@@ -12,18 +12,26 @@ from FiberFusing.helper import OverlayStructureBaseClass
 
 class NameSpace:
     """
-    A flexible class that allows dynamic addition of attributes via keyword arguments.
+    A lightweight container holding the index, polygon and name of a structure.
     """
-    def __init__(self, **kwargs):
+    __slots__ = ('index', 'polygon', 'name')
+
+    def __init__(self, index: float, polygon: object, name: str):
         """
-        Initializes an instance with attributes specified by keyword arguments.
+        Initializes an instance with the given index, polygon and name.
 
         Parameters
         ----------
-        **kwargs : dict
-            Arbitrary keyword arguments to set as attributes.
+        index : float
+            Refractive index of the structure.
+        polygon : object
+            Polygon of the structure.
+        name : str
+            Name of the structure.
         """
-        self.__dict__.update(kwargs)
+        self.index = index
+        self.polygon = polygon
+        self.name = name
 
 
 @dataclass(config=ConfigDict(extra='forbid', kw_only=True))
@@ -53,6 +61,7 @@ class BackGround(OverlayStructureBaseClass):
 
         polygon = Circle(position=self.position, radius=self.radius, index=self.index)
         self.structure_list = [NameSpace(index=self.index, polygon=polygon, name='background')]
+        self._refractive_index_list = [self.index]
 
     @property
     def refractive_index_list(self) -> list:
@@ -64,7 +73,7 @@ class BackGround(OverlayStructureBaseClass):
         list
             A list containing the refractive index of the background.
         """
-        return [self.index]
+        return self._refractive_index_list
 
     def overlay_structures_on_mesh(self, mesh: np.ndarray, coordinate_system: CoordinateSystem) -> np.ndarray:
         """
@@ -82,8 +91,10 @@ class BackGround(OverlayStructureBaseClass):
         np.ndarray
             A numpy ndarray with the structures overlayed onto the original mesh.
         """
-        return self._overlay_structure_on_mesh_(
-            structure_list=self.structure_list,
+        background, = self.structure_list
+        return self._overlay_single_structure_on_mesh_(
+            polygon=background.polygon,
+            index=background.index,
             mesh=mesh,
             coordinate_system=coordinate_system
         )
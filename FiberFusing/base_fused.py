@@ -2,32 +2,32 @@
 # -*- coding: utf-8 -*-
 
 from __future__ import annotations
-from typing import Union, Optional, List, Dict, Tuple
-import matplotlib.pyplot as plt
+from typing import Union, Optional, List, Dict, Tuple, TYPE_CHECKING
 import numpy as np
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from FiberFusing.coordinate_system import CoordinateSystem
 from FiberFusing.buffer import Circle
+from FiberFusing.components.point import Point
+from FiberFusing.components.base_class import transform_geometries, _affine_transform_coordinates, _rotate_matrix, _translate_matrix
 from FiberFusing.fiber_structure import FiberLine, FiberRing
-from FiberFusing.utils import union_geometries
+from FiberFusing.utils import cascaded_union_geometries
 from FiberFusing.helper import _plot_helper, OverlayStructureBaseClass
 
-logging.basicConfig(level=logging.INFO)
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
 
+logging.basicConfig(level=logging.INFO)
 
-class NameSpace:
-    """
-    A flexible class that allows the dynamic addition of attributes via keyword arguments.
-    """
+# Structure class and name of its rotation keyword for each structure_type accepted by BaseFused.add_structure
+_STRUCTURE_TYPES = {
+    'ring': (FiberRing, 'angle_shift'),
+    'line': (FiberLine, 'rotation_angle'),
+}
 
-    def __init__(self, **kwargs):
-        """
-        Initializes an instance with attributes specified by the keyword arguments.
-
-        :param kwargs: Arbitrary keyword arguments to set as attributes.
-        """
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+# Shared generator for the core position randomization, created once rather than per call.
+# Pass a seed to BaseFused.randomize_core_position for reproducible cores.
+_RNG = np.random.default_rng()
 
 
 class BaseFused(OverlayStructureBaseClass):
@@ -65,6 +65,7 @@ class BaseFused(OverlayStructureBaseClass):
         """
         self.fiber_radius = fiber_radius
         self.index = index
+        self._refractive_index_list = [index]
         self.tolerance_factor = tolerance_factor
 
         self.scale_down_position = scale_down_position
@@ -75,14 +76,73 @@ class BaseFused(OverlayStructureBaseClass):
     def _compute_structure(self) -> None:
         self.fiber_list = []
         self.core_list = []
-        self._clad_structure = None
         self.structure_list = []
+        self._structure_list_version = 0
+        self._clad_structure = None
+        self._clad_structure_version = -1
+        self._is_multi = None
+        self._is_multi_version = -1
+        self._bounds = None
+        self._bounds_version = -1
         self.removed_section_list = []
         self.added_section_list = []
+        self._removed_section_cache = None
+        self._added_section_cache = None
+
+        # Structure-of-arrays mirror of fiber_list: fiber centers and (shifted) core positions.
+        self._positions = np.empty((0, 2), dtype=np.float64)
+        self._cores = np.empty((0, 2), dtype=np.float64)
+        self._cores_cache = None
+        self._core_positions_cache = None
 
         self.initialize_structure()
 
-    def randomize_core_position(self, random_factor: float = 0) -> "BaseFused":
+    def _append_fibers(self, fibers: List[Circle]) -> None:
+        """
+        Append the fibers to the fiber list and to the position and core arrays.
+
+        Parameters
+        ----------
+        fibers : list of Circle
+            The fibers to register, their cores must already be at their final position.
+        """
+        fibers = list(fibers)
+        if not fibers:
+            return
+
+        start = len(self.fiber_list)
+        self.fiber_list.extend(fibers)
+
+        positions = np.asarray([(fiber.core.x, fiber.core.y) for fiber in fibers], dtype=np.float64)
+        cores = np.asarray(
+            [(fiber.shifted_core.x, fiber.shifted_core.y) if hasattr(fiber, 'shifted_core') else (fiber.core.x, fiber.core.y) for fiber in fibers],
+            dtype=np.float64
+        )
+
+        self._positions = np.concatenate([self._positions, positions])
+        self._cores = np.concatenate([self._cores, cores])
+
+        # Only the appended fibers need their points, the others are unchanged
+        self._update_fiber_views(start=start)
+
+    def _update_fiber_views(self, start: int = 0) -> None:
+        """
+        Write the position and core arrays back onto the `core` and `shifted_core` points of each fiber.
+
+        Parameters
+        ----------
+        start : int, optional
+            Index of the first fiber to update, the fibers before it are left untouched. Default is 0.
+        """
+        # Each Point keeps a row of a private copy as its coordinates, no shapely point or validation is needed
+        for fiber, position, core in zip(self.fiber_list[start:], self._positions[start:].copy(), self._cores[start:].copy()):
+            fiber.core = Point._from_array(position)
+            fiber.shifted_core = Point._from_array(core)
+
+        self._cores_cache = None
+        self._core_positions_cache = None
+
+    def randomize_core_position(self, random_factor: float = 0, seed: Optional[int] = None) -> "BaseFused":
         """
         Randomize the position of fiber cores to simulate real-world imperfections.
 
@@ -90,6 +150,9 @@ class BaseFused(OverlayStructureBaseClass):
         ----------
         random_factor : float, optional
             Factor determining the randomness in position. Default is 0.
+        seed : int, optional
+            Seed of the random generator, calls with the same seed give the same cores.
+            If None (default), the shared module generator is used.
 
         Returns
         -------
@@ -100,10 +163,11 @@ class BaseFused(OverlayStructureBaseClass):
             return self
 
         logging.info("Randomizing core positions.")
-        for fiber in self.fiber_list:
-            fiber.shifted_core = fiber.core
-            random_shift = np.random.rand(2) * random_factor
-            fiber.shifted_core.translate(random_shift, in_place=True)
+        rng = _RNG if seed is None else np.random.default_rng(seed)
+        random_shifts = rng.random(self._positions.shape) * random_factor
+        self._cores = self._positions + random_shifts
+
+        self._update_fiber_views()
 
         return self
 
@@ -136,15 +200,50 @@ class BaseFused(OverlayStructureBaseClass):
         """
         Get the clad structure, computing it if necessary.
 
+        The union is cached and only recomputed when a structure was added since the last access.
+        Rotations and translations are applied in place on the cached polygon and on the structures.
+
         Returns
         -------
         Polygon
             The union of all structures in the assembly.
         """
-        if self._clad_structure is None:
-            self._clad_structure = union_geometries(*self.structure_list)
+        if self._clad_structure_version != self._structure_list_version:
+            self._clad_structure = cascaded_union_geometries(self.structure_list)
+            self._clad_structure_version = self._structure_list_version
         return self._clad_structure
 
+    @property
+    def is_multi(self) -> bool:
+        """
+        Check if the clad structure is made of several disjoint polygons.
+
+        The result is cached alongside the clad structure, rotations and translations do not change it.
+
+        Returns
+        -------
+        bool
+            True if the clad structure is a MultiPolygon, False otherwise.
+        """
+        if self._is_multi_version != self._structure_list_version:
+            self._is_multi = self.clad_structure.is_multi
+            self._is_multi_version = self._structure_list_version
+        return self._is_multi
+
+    @property
+    def refractive_index_list(self) -> List[float]:
+        """
+        Get the list of refractive indices of the structure.
+
+        Returns
+        -------
+        list of float
+            A list containing the refractive index of the clad structure.
+        """
+        if self._refractive_index_list[0] != self.index:
+            self._refractive_index_list = [self.index]
+        return self._refractive_index_list
+
     @property
     def structure_dictionary(self) -> Dict[str, Dict[str, object]]:
         """
@@ -173,9 +272,11 @@ class BaseFused(OverlayStructureBaseClass):
         np.ndarray
             The mesh with fiber structures overlaid.
         """
-        structure_list = [NameSpace(index=self.index, polygon=self.clad_structure)]
-        return self._overlay_structure_on_mesh_(
-            structure_list=structure_list, mesh=mesh, coordinate_system=coordinate_system
+        return self._overlay_single_structure_on_mesh_(
+            polygon=self.clad_structure,
+            index=self.index,
+            mesh=mesh,
+            coordinate_system=coordinate_system
         )
 
     def get_structure_max_min_boundaries(self) -> Tuple[float, float, float, float]:
@@ -187,7 +288,21 @@ class BaseFused(OverlayStructureBaseClass):
         tuple
             The bounding box of the clad structure.
         """
-        return self.clad_structure.bounds
+        return self._get_bounds()
+
+    def _get_bounds(self) -> Tuple[float, float, float, float]:
+        """
+        Return the bounds of the clad structure, cached until the structure list or the clad changes.
+
+        Returns
+        -------
+        tuple
+            The (min_x, min_y, max_x, max_y) bounding box of the clad structure.
+        """
+        if self._bounds_version != self._structure_list_version:
+            self._bounds = self.clad_structure.bounds
+            self._bounds_version = self._structure_list_version
+        return self._bounds
 
     def add_single_fiber(self, fiber_radius: float, position: Tuple[float, float] = (0, 0)) -> "BaseFused":
         """
@@ -209,7 +324,8 @@ class BaseFused(OverlayStructureBaseClass):
         fiber.shifted_core = fiber.center
 
         self.structure_list.append(fiber)
-        self.fiber_list.append(fiber)
+        self._structure_list_version += 1
+        self._append_fibers([fiber])
 
         return self
 
@@ -274,6 +390,43 @@ class BaseFused(OverlayStructureBaseClass):
         BaseFused
             The updated BaseFused instance.
         """
+        self._prepare_structure_(
+            structure=structure,
+            fusion_degree=fusion_degree,
+            scale_position=scale_position,
+            position_shift=position_shift,
+            compute_fusing=compute_fusing
+        )
+
+        if compute_fusing:
+            self._fuse_structure_(structure)
+
+        return self._register_structure_(structure=structure, compute_fusing=compute_fusing)
+
+    def _prepare_structure_(
+        self,
+        structure: Union[FiberRing, FiberLine],
+        fusion_degree: float,
+        scale_position: float,
+        position_shift: List[float],
+        compute_fusing: bool
+    ) -> None:
+        """
+        Place the fibers of a structure according to its fusion degree, scaling and shift.
+
+        Parameters
+        ----------
+        structure : Union[FiberRing, FiberLine]
+            The fiber structure to place.
+        fusion_degree : float
+            The degree of fusion.
+        scale_position : float
+            Factor to scale the position.
+        position_shift : list of float
+            Shift vector for the position.
+        compute_fusing : bool
+            Whether the fusing operation will be computed.
+        """
         if compute_fusing:
             structure.set_fusion_degree(fusion_degree=fusion_degree)
 
@@ -281,17 +434,55 @@ class BaseFused(OverlayStructureBaseClass):
         structure.shift_position(shift=position_shift)
         structure.initialize_cores()
 
-        self.fiber_list.extend(structure.fiber_list)
+    @staticmethod
+    def _fuse_structure_(structure: Union[FiberRing, FiberLine]) -> None:
+        """
+        Compute the optimal fused geometry and core positions of a structure.
+
+        Parameters
+        ----------
+        structure : Union[FiberRing, FiberLine]
+            The fiber structure to fuse.
+        """
+        structure.init_connected_fibers()
+        structure.compute_optimal_structure()
+
+    def _register_structure_(
+        self,
+        structure: Union[FiberRing, FiberLine],
+        compute_fusing: bool,
+        append_fibers: bool = True
+    ) -> "BaseFused":
+        """
+        Append a placed (and possibly fused) structure to the instance.
+
+        Parameters
+        ----------
+        structure : Union[FiberRing, FiberLine]
+            The fiber structure to append.
+        compute_fusing : bool
+            Whether the fusing operation was computed for the structure.
+        append_fibers : bool, optional
+            Whether to append the fibers of the structure to the core arrays. Batch callers set it to
+            False and append all the fibers at once. Default is True.
 
+        Returns
+        -------
+        BaseFused
+            The updated BaseFused instance.
+        """
         if compute_fusing:
-            structure.init_connected_fibers()
-            structure.compute_optimal_structure()
             self.removed_section_list.append(structure.removed_section)
             self.added_section_list.append(structure.added_section)
+            self._removed_section_cache = self._added_section_cache = None
             self.structure_list.append(structure.fused_structure)
         else:
             self.structure_list.append(structure.unfused_structure)
 
+        self._structure_list_version += 1
+        if append_fibers:
+            self._append_fibers(structure.fiber_list)
+
         return self
 
     def add_structure(
@@ -311,7 +502,7 @@ class BaseFused(OverlayStructureBaseClass):
         Parameters
         ----------
         structure_type : str
-            The type of structure to add ('ring' or 'line').
+            The type of structure to add ('ring' or 'line'), case-insensitive.
         number_of_fibers : int
             Number of fibers in the structure.
         fiber_radius : float
@@ -331,19 +522,18 @@ class BaseFused(OverlayStructureBaseClass):
         -------
         BaseFused
             The updated BaseFused instance.
-        """
 
-        if structure_type.lower() == 'ring':
-            structure = FiberRing(
-                number_of_fibers=number_of_fibers,
-                fiber_radius=fiber_radius,
-                angle_shift=angle_shift
-            )
-        else:
-            structure = FiberLine(
-                number_of_fibers=number_of_fibers,
-                fiber_radius=fiber_radius,
-            )
+        Raises
+        ------
+        ValueError
+            If the structure type is not one of 'ring' or 'line'.
+        """
+        structure = self._build_structure_(
+            structure_type=structure_type,
+            number_of_fibers=number_of_fibers,
+            fiber_radius=fiber_radius,
+            angle_shift=angle_shift
+        )
 
         return self._add_structure_to_instance_(
             structure=structure,
@@ -353,6 +543,101 @@ class BaseFused(OverlayStructureBaseClass):
             compute_fusing=compute_fusing
         )
 
+    def add_structures(self, structure_specs: List[Dict[str, object]], max_workers: Optional[int] = None) -> "BaseFused":
+        """
+        Add several predefined structures at once, computing their fusing operations in parallel.
+
+        Each structure is built and placed sequentially, the independent fusing optimizations are then
+        run in a thread pool (the GEOS operations release the GIL) and the results are appended in the
+        order of the specifications.
+
+        Parameters
+        ----------
+        structure_specs : list of dict
+            Keyword arguments of :meth:`add_structure`, one dictionary per structure.
+        max_workers : int, optional
+            Maximum number of threads used for the fusing operations. Default is None (executor default).
+
+        Returns
+        -------
+        BaseFused
+            The updated BaseFused instance.
+
+        Raises
+        ------
+        ValueError
+            If a structure type is not one of 'ring' or 'line'.
+        """
+        prepared_structures = []
+        for spec in structure_specs:
+            spec = dict(spec)
+            fusion_kwargs = dict(
+                fusion_degree=spec.pop('fusion_degree', 0.0),
+                scale_position=spec.pop('scale_position', 1.0),
+                position_shift=spec.pop('position_shift', [0, 0]),
+                compute_fusing=spec.pop('compute_fusing', False)
+            )
+            structure = self._build_structure_(**spec)
+            self._prepare_structure_(structure=structure, **fusion_kwargs)
+            prepared_structures.append((structure, fusion_kwargs['compute_fusing']))
+
+        structures_to_fuse = [structure for structure, compute_fusing in prepared_structures if compute_fusing]
+        if structures_to_fuse:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(self._fuse_structure_, structures_to_fuse))
+
+        fibers = []
+        for structure, compute_fusing in prepared_structures:
+            self._register_structure_(structure=structure, compute_fusing=compute_fusing, append_fibers=False)
+            fibers.extend(structure.fiber_list)
+
+        # Grow the position, radius and core arrays once for the whole batch
+        self._append_fibers(fibers)
+
+        return self
+
+    def _build_structure_(
+        self,
+        structure_type: str,
+        number_of_fibers: int,
+        fiber_radius: float,
+        angle_shift: float = 0.0
+    ) -> Union[FiberRing, FiberLine]:
+        """
+        Instantiate the fiber structure corresponding to a structure type.
+
+        Parameters
+        ----------
+        structure_type : str
+            The type of structure ('ring' or 'line'), case-insensitive.
+        number_of_fibers : int
+            Number of fibers in the structure.
+        fiber_radius : float
+            Radius of each fiber in the structure.
+        angle_shift : float, optional
+            The angle by which to rotate the structure. Default is 0.0.
+
+        Returns
+        -------
+        Union[FiberRing, FiberLine]
+            The new fiber structure.
+
+        Raises
+        ------
+        ValueError
+            If the structure type is not one of 'ring' or 'line'.
+        """
+        try:
+            structure_class, angle_keyword = _STRUCTURE_TYPES[structure_type.lower()]
+        except KeyError:
+            raise ValueError(f"Invalid structure_type '{structure_type}'. Valid inputs are {list(_STRUCTURE_TYPES)}.")
+
+        return structure_class(
+            number_of_fibers=number_of_fibers,
+            fiber_radius=fiber_radius,
+            **{angle_keyword: angle_shift}
+        )
+
     def add_custom_fiber(self, *fibers) -> None:
         """
         Add custom-defined fibers to the structure.
@@ -362,22 +647,34 @@ class BaseFused(OverlayStructureBaseClass):
         fibers : variable
             Custom fiber objects to be added.
         """
-        self.fiber_list.extend(fibers)
+        self._append_fibers(fibers)
 
     @property
     def cores(self) -> List:
-        return [fiber.shifted_core for fiber in self.fiber_list]
+        """
+        Get the (shifted) core points of all fibers, cached until the cores move.
 
-    def get_core_positions(self) -> List[Tuple[float, float]]:
+        Returns
+        -------
+        list of Point
+            The core points, one per fiber.
+        """
+        if self._cores_cache is None:
+            self._cores_cache = [fiber.shifted_core for fiber in self.fiber_list]
+        return self._cores_cache
+
+    def get_core_positions(self) -> List[Point]:
         """
-        Get a list of core positions for all fibers in the structure.
+        Get a list of core positions for all fibers in the structure, cached until the fibers move.
 
         Returns
         -------
-        list of tuple
+        list of Point
             A list of core positions.
         """
-        return [fiber.core for fiber in self.fiber_list]
+        if self._core_positions_cache is None:
+            self._core_positions_cache = [fiber.core for fiber in self.fiber_list]
+        return self._core_positions_cache
 
     def get_rasterized_mesh(self, coordinate_system: CoordinateSystem) -> np.ndarray:
         """
@@ -395,6 +692,54 @@ class BaseFused(OverlayStructureBaseClass):
         """
         return self.clad_structure.get_rasterized_mesh(coordinate_system=coordinate_system)
 
+    def _transform_cores(self, matrix: Tuple[float, ...]) -> None:
+        """
+        Apply an affine matrix to every fiber and its cores.
+
+        The position and core arrays are transformed with the same coordinate math as the polygons,
+        and the fiber polygons with a single vectorized call of :func:`transform_geometries`.
+
+        Parameters
+        ----------
+        matrix : tuple of float
+            The (a, b, d, e, xoff, yoff) affine matrix, e.g. from :func:`_rotate_matrix`.
+        """
+        self._positions = _affine_transform_coordinates(self._positions, matrix)
+        self._cores = _affine_transform_coordinates(self._cores, matrix)
+
+        transform_geometries(self.fiber_list, matrix=matrix)
+
+        self._update_fiber_views()
+
+    def _transform_structures(self, matrix: Tuple[float, ...]) -> None:
+        """
+        Apply an affine matrix in place to the structures, the sections and their cached unions.
+
+        The fibers are skipped as they were already moved by :meth:`_transform_cores`. The cached clad
+        structure is moved with the structures it was built from, so it stays valid and structures
+        added afterwards are merged with the moved ones.
+
+        Parameters
+        ----------
+        matrix : tuple of float
+            The (a, b, d, e, xoff, yoff) affine matrix, e.g. from :func:`_rotate_matrix`.
+        """
+        cached_unions = [self._removed_section_cache, self._added_section_cache]
+        if self._clad_structure_version == self._structure_list_version:
+            cached_unions.append(self._clad_structure)
+
+        skipped = {id(fiber) for fiber in self.fiber_list}
+        geometries = []
+        for geometry in [*self.structure_list, *self.removed_section_list, *self.added_section_list, *cached_unions]:
+            if geometry is not None and id(geometry) not in skipped:
+                skipped.add(id(geometry))
+                geometries.append(geometry)
+
+        # The same matrix is applied to every structure, section and cached union in one vectorized call
+        transform_geometries(geometries, matrix=matrix)
+
+        self._bounds_version = -1
+
     def rotate(self, angle: float) -> "BaseFused":
         """
         Rotate the entire structure, including fiber cores.
@@ -404,19 +749,12 @@ class BaseFused(OverlayStructureBaseClass):
         BaseFused
             The updated BaseFused instance.
         """
-        for fiber in self.fiber_list:
-            fiber.rotate(angle, in_place=True)
-            fiber.core.rotate(angle, in_place=True)
-            fiber.shifted_core.rotate(angle, in_place=True)
-            fiber.center.rotate(angle, in_place=True)
-
-        self.clad_structure.rotate(angle, in_place=True)
+        # Same matrix (and quarter-turn rounding) for the cores and for every polygon
+        matrix = _rotate_matrix(angle)
 
-        for element in self.removed_section_list:
-            element.rotate(angle, in_place=True)
+        self._transform_cores(matrix=matrix)
 
-        for element in self.added_section_list:
-            element.rotate(angle, in_place=True)
+        self._transform_structures(matrix=matrix)
 
         return self
 
@@ -429,19 +767,11 @@ class BaseFused(OverlayStructureBaseClass):
         BaseFused
             The updated BaseFused instance.
         """
-        for fiber in self.fiber_list:
-            fiber.translate(shift, in_place=True)
-            fiber.core.translate(shift, in_place=True)
-            fiber.shifted_core.translate(shift, in_place=True)
-            fiber.center.translate(shift, in_place=True)
-
-        self.clad_structure.translate(shift, in_place=True)
+        matrix = _translate_matrix(*shift)
 
-        for element in self.removed_section_list:
-            element.translate(shift, in_place=True)
+        self._transform_cores(matrix=matrix)
 
-        for element in self.added_section_list:
-            element.translate(shift, in_place=True)
+        self._transform_structures(matrix=matrix)
 
         return self
 
@@ -459,23 +789,36 @@ class BaseFused(OverlayStructureBaseClass):
         BaseFused
             The updated BaseFused instance.
         """
-        for fiber in self.fiber_list:
-            fiber.scale_position(factor=factor)
+        if factor == 1:
+            return self
+
+        shifts = self._positions * (factor - 1)
+        self._positions = self._positions + shifts
+        self._cores = self._cores + shifts
+
+        for fiber, shift in zip(self.fiber_list, shifts):
+            fiber.translate(shift=(shift[0], shift[1]), in_place=True)
+
+        self._update_fiber_views()
 
         return self
 
     @property
     def removed_section(self) -> object:
-        return union_geometries(*self.removed_section_list)
+        if self._removed_section_cache is None:
+            self._removed_section_cache = cascaded_union_geometries(self.removed_section_list)
+        return self._removed_section_cache
 
     @property
     def added_section(self) -> object:
-        return union_geometries(*self.added_section_list)
+        if self._added_section_cache is None:
+            self._added_section_cache = cascaded_union_geometries(self.added_section_list)
+        return self._added_section_cache
 
     @_plot_helper
     def plot(
             self,
-            ax: plt.Axis = None,
+            ax: "plt.Axes" = None,
             show_structure: bool = True,
             show_centers: bool = False,
             show_cores: bool = True,
@@ -2,17 +2,56 @@
 # -*- coding: utf-8 -*-
 
 from typing import Tuple, Optional
+from functools import lru_cache
+import numpy
 from pydantic.dataclasses import dataclass
 from pydantic import ConfigDict
+import shapely
 import shapely.geometry as geo
-from shapely import affinity
 
 from FiberFusing.components.utils import interpret_to_point
+from FiberFusing.components.point import Point
 from FiberFusing.components.polygon import Polygon
+from FiberFusing.components.base_class import _get_rectangle_bounds
+from FiberFusing.coordinate_system import CoordinateSystem
 
 config_dict = ConfigDict(extra='forbid', strict=True, kw_only=True)
 
 
+@lru_cache(maxsize=None)
+def _get_unit_circle(resolution: int) -> numpy.ndarray:
+    """
+    Return the vertices of a unit circle centered at the origin, computed once per resolution.
+
+    The vertices follow the same layout as a shapely point buffer: 4 * resolution segments, clockwise,
+    starting at angle 0.
+
+    Parameters
+    ----------
+    resolution : int
+        The number of segments per quarter circle.
+
+    Returns
+    -------
+    numpy.ndarray
+        A read-only (4 * resolution, 2) array of the (x, y) vertices.
+    """
+    angles = -numpy.linspace(0, 2 * numpy.pi, 4 * resolution, endpoint=False)
+    unit_circle = numpy.column_stack([numpy.cos(angles), numpy.sin(angles)])
+    unit_circle.setflags(write=False)
+    return unit_circle
+
+
+def _as_raster(mask: numpy.ndarray, dtype: type) -> numpy.ndarray:
+    """
+    Convert a boolean (ny, nx) mask to a raster of the given data type, without a copy for int8.
+    """
+    if numpy.dtype(dtype) == numpy.int8:
+        return mask.view(numpy.int8)
+
+    return mask.astype(dtype)
+
+
 @dataclass(config=config_dict)
 class Circle(Polygon):
     """
@@ -49,14 +88,46 @@ class Circle(Polygon):
         if self.radius <= 0:
             raise ValueError("Radius must be a positive value.")
 
-        # Create a circular geometry using buffer
-        circle = self.position._shapely_object.buffer(
-            self.radius,
-            resolution=self.resolution
+        # Scale and shift the unit circle template instead of buffering the center
+        vertices = _get_unit_circle(self.resolution) * self.radius + (self.position.x, self.position.y)
+
+        self._shapely_object = shapely.polygons(shapely.linearrings(vertices))
+        # The circle is symmetric around its position, which is therefore its centroid
+        self.core = self.position.copy()
+
+    def rasterize(self, coordinate_system: CoordinateSystem, dtype: type = numpy.int8) -> numpy.ndarray:
+        """
+        Rasterizes the circle to a grid based on a coordinate system.
+
+        The polygon is rasterized, so the raster agrees with :meth:`contains_points` and the boolean
+        operations, and the result is cached as fibers are rasterized repeatedly on the same grid.
+
+        Parameters
+        ----------
+        coordinate_system : CoordinateSystem
+            The coordinate system used for rasterization.
+        dtype : type, optional
+            The data type of the raster. Default is int8.
+
+        Returns
+        -------
+        numpy.ndarray
+            A 2D array where 1 indicates the presence of the circle and 0 indicates its absence.
+        """
+        # The mask is kept until the grid or the geometry changes
+        key = (
+            coordinate_system.nx, coordinate_system.ny,
+            coordinate_system.min_x, coordinate_system.max_x,
+            coordinate_system.min_y, coordinate_system.max_y
         )
+        cache = getattr(self, '_raster_cache', None)
+        if cache is None or cache[0] != key or cache[1] is not self._shapely_object:
+            mask = super().rasterize(coordinate_system, dtype=numpy.int8)
+            mask.setflags(write=False)
+            self._raster_cache = cache = (key, self._shapely_object, mask)
 
-        self._shapely_object = circle
-        self.core = self.center.copy()
+        # Callers scale the raster in place, so they get their own copy of the cached mask
+        return cache[2].astype(dtype)
 
 
 @dataclass(config=config_dict)
@@ -100,21 +171,16 @@ class Ellipse(Polygon):
         if self.ratio <= 0:
             raise ValueError("Ratio must be a positive value.")
 
-        ellipse = self.position._shapely_object.buffer(
-            self.radius,
-            resolution=self.resolution
-        )
+        vertices = _get_unit_circle(self.resolution) * self.radius + (self.position.x, self.position.y)
 
-        # Scale the ellipse according to the ratio
-        ellipse = affinity.scale(
-            ellipse,
-            xfact=1,
-            yfact=self.ratio,
-            origin=(0, 0)
-        )
+        # Scale the ellipse according to the ratio (around the origin)
+        vertices[:, 1] *= self.ratio
+
+        ellipse = shapely.polygons(shapely.linearrings(vertices))
 
         super().__init__(instance=ellipse)
-        self.core = self.center.copy()
+        # The ellipse is symmetric around its (scaled) position, which is therefore its centroid
+        self.core = Point._from_xy(self.position.x, self.position.y * self.ratio)
 
 
 @dataclass(config=config_dict)
@@ -158,6 +224,66 @@ class Square(Polygon):
         )
 
         super().__init__(instance=square)
-        self.core = self.center.copy()
+        # The square is symmetric around its position, which is therefore its centroid
+        self.core = self.position.copy()
+
+    def contains_points(self, coordinates: numpy.ndarray) -> numpy.ndarray:
+        """
+        Checks which of the provided coordinates lie within the square.
+
+        While the square is axis-aligned the test reduces to comparing the coordinates with its bounds,
+        otherwise (e.g. after a rotation) the generic polygon test is used.
+
+        Parameters
+        ----------
+        coordinates : numpy.ndarray
+            A (N, 2) array of the coordinates to check.
+
+        Returns
+        -------
+        numpy.ndarray
+            A boolean array where True indicates that the coordinate is inside the square.
+        """
+        bounds = _get_rectangle_bounds(self._shapely_object)
+        if bounds is None:
+            return super().contains_points(coordinates)
+
+        min_x, min_y, max_x, max_y = bounds
+        x, y = coordinates[:, 0], coordinates[:, 1]
+
+        # Half-open bounds, same boundary convention as the crossing-number test
+        return (min_x <= x) & (x < max_x) & (min_y <= y) & (y < max_y)
+
+    def rasterize(self, coordinate_system: CoordinateSystem, dtype: type = numpy.int8) -> numpy.ndarray:
+        """
+        Rasterizes the square to a grid based on a coordinate system.
+
+        While the square is axis-aligned the raster is obtained by comparing the grid axes with its bounds,
+        otherwise (e.g. after a rotation) the polygon is rasterized.
+
+        Parameters
+        ----------
+        coordinate_system : CoordinateSystem
+            The coordinate system used for rasterization.
+        dtype : type, optional
+            The data type of the raster. Default is int8.
+
+        Returns
+        -------
+        numpy.ndarray
+            A 2D array where 1 indicates the presence of the square and 0 indicates its absence.
+        """
+        bounds = _get_rectangle_bounds(self._shapely_object)
+        if bounds is None:
+            return super().rasterize(coordinate_system, dtype=dtype)
+
+        min_x, min_y, max_x, max_y = bounds
+        x, y = coordinate_system.x_vector, coordinate_system.y_vector
+
+        # Half-open bounds, same boundary convention as the scanline rasterization
+        in_x = (min_x <= x) & (x < max_x)
+        in_y = (min_y <= y) & (y < max_y)
+
+        return _as_raster(in_y[:, numpy.newaxis] & in_x[numpy.newaxis, :], dtype)
 
 # -
@@ -2,46 +2,402 @@
 # -*- coding: utf-8 -*-
 
 import copy
+import functools
+import math
 import numpy as np
-from typing import Iterable, Tuple, Callable
-from shapely import affinity
+from typing import Iterable, Tuple, Callable, Optional
+import shapely
 import shapely.geometry as geo
 from FiberFusing.coordinate_system import CoordinateSystem
 from shapely.ops import split
 import FiberFusing as ff
 
 
+def _get_rectangle_bounds(geometry) -> Optional[Tuple[float, float, float, float]]:
+    """
+    Return the bounds of a geometry if it is an axis-aligned rectangle.
+
+    Parameters
+    ----------
+    geometry : shapely.geometry
+        The geometry to inspect.
+
+    Returns
+    -------
+    tuple of float or None
+        The (minx, miny, maxx, maxy) bounds of the rectangle, or None if the geometry is anything else.
+    """
+    if not isinstance(geometry, geo.Polygon) or shapely.get_num_coordinates(geometry) != 5:
+        return None
+
+    if shapely.get_num_interior_rings(geometry) != 0:
+        return None
+
+    coordinates = shapely.get_coordinates(geometry)
+    min_x, min_y = coordinates.min(axis=0)
+    max_x, max_y = coordinates.max(axis=0)
+
+    on_corner = np.isin(coordinates[:, 0], (min_x, max_x)) & np.isin(coordinates[:, 1], (min_y, max_y))
+
+    # Every vertex must be a corner of the bounding box and every edge must move along a single axis
+    if not on_corner.all() or not (np.count_nonzero(np.diff(coordinates, axis=0), axis=1) == 1).all():
+        return None
+
+    return min_x, min_y, max_x, max_y
+
+
+def _rectangle_union(bounds_0: Tuple, bounds_1: Tuple) -> Optional[Tuple[float, float, float, float]]:
+    """
+    Return the bounds of the union of two axis-aligned rectangles, if that union is itself a rectangle.
+
+    Parameters
+    ----------
+    bounds_0 : tuple of float
+        The (minx, miny, maxx, maxy) bounds of the first rectangle.
+    bounds_1 : tuple of float
+        The (minx, miny, maxx, maxy) bounds of the second rectangle.
+
+    Returns
+    -------
+    tuple of float or None
+        The bounds of the union, or None if the union is not a rectangle.
+    """
+    (ax0, ay0, ax1, ay1), (bx0, by0, bx1, by1) = bounds_0, bounds_1
+
+    if ax0 <= bx0 and ay0 <= by0 and bx1 <= ax1 and by1 <= ay1:
+        return bounds_0
+
+    if bx0 <= ax0 and by0 <= ay0 and ax1 <= bx1 and ay1 <= by1:
+        return bounds_1
+
+    # Rectangles sharing a full side (or its span) and touching or overlapping along the other axis
+    if ax0 == bx0 and ax1 == bx1 and ay0 <= by1 and by0 <= ay1:
+        return ax0, min(ay0, by0), ax1, max(ay1, by1)
+
+    if ay0 == by0 and ay1 == by1 and ax0 <= bx1 and bx0 <= ax1:
+        return min(ax0, bx0), ay0, max(ax1, bx1), ay1
+
+    return None
+
+
+def _are_squares(*geometries) -> bool:
+    """
+    Tell whether every operand of a boolean operation is a Square.
+
+    Only squares are axis-aligned rectangles often enough for the rectangle shortcuts of
+    :func:`_fast_union` and :func:`_fast_intersection` to pay for their geometry check.
+    """
+    return all(isinstance(geometry, ff.Square) for geometry in geometries)
+
+
+def _fast_union(geometry, *others):
+    """
+    Compute the union of axis-aligned rectangles without going through GEOS.
+
+    Parameters
+    ----------
+    geometry : shapely.geometry
+        The first geometry.
+    *others : shapely.geometry
+        The other geometries.
+
+    Returns
+    -------
+    shapely.geometry.Polygon or None
+        The union as a rectangle, or None if an operand is not a rectangle or the union is not one.
+    """
+    bounds = _get_rectangle_bounds(geometry)
+
+    for other in others:
+        if bounds is None:
+            return None
+        other_bounds = _get_rectangle_bounds(other)
+        if other_bounds is None:
+            return None
+        bounds = _rectangle_union(bounds, other_bounds)
+
+    return None if bounds is None else geo.box(*bounds)
+
+
+def _fast_intersection(geometry, *others):
+    """
+    Compute the intersection of axis-aligned rectangles without going through GEOS.
+
+    Parameters
+    ----------
+    geometry : shapely.geometry
+        The first geometry.
+    *others : shapely.geometry
+        The other geometries.
+
+    Returns
+    -------
+    shapely.geometry.Polygon or None
+        The intersection as a rectangle (empty if they are disjoint), or None if an operand is not a
+        rectangle or the rectangles only touch, in which case GEOS decides the resulting geometry type.
+    """
+    bounds = _get_rectangle_bounds(geometry)
+    if bounds is None:
+        return None
+
+    min_x, min_y, max_x, max_y = bounds
+
+    for other in others:
+        other_bounds = _get_rectangle_bounds(other)
+        if other_bounds is None:
+            return None
+        min_x, min_y = max(min_x, other_bounds[0]), max(min_y, other_bounds[1])
+        max_x, max_y = min(max_x, other_bounds[2]), min(max_y, other_bounds[3])
+
+    if min_x < max_x and min_y < max_y:
+        return geo.box(min_x, min_y, max_x, max_y)
+
+    if min_x > max_x or min_y > max_y:
+        return geo.Polygon()
+
+    return None
+
+
+def _translate_matrix(x_offset: float, y_offset: float) -> Tuple[float, ...]:
+    """
+    Return the (a, b, d, e, xoff, yoff) affine matrix of a translation.
+
+    Parameters
+    ----------
+    x_offset : float
+        The shift along x.
+    y_offset : float
+        The shift along y.
+
+    Returns
+    -------
+    tuple of float
+        The affine matrix, in the coefficient order of ``shapely.affinity.affine_transform``.
+    """
+    return 1.0, 0.0, 0.0, 1.0, x_offset, y_offset
+
+
+def _scale_matrix(x_factor: float, y_factor: float, x_origin: float = 0.0, y_origin: float = 0.0) -> Tuple[float, ...]:
+    """
+    Return the (a, b, d, e, xoff, yoff) affine matrix of a scaling around an origin.
+
+    Parameters
+    ----------
+    x_factor : float
+        The scaling factor along x.
+    y_factor : float
+        The scaling factor along y.
+    x_origin : float, optional
+        The x coordinate of the fixed point, by default 0.
+    y_origin : float, optional
+        The y coordinate of the fixed point, by default 0.
+
+    Returns
+    -------
+    tuple of float
+        The affine matrix, in the coefficient order of ``shapely.affinity.affine_transform``.
+    """
+    return x_factor, 0.0, 0.0, y_factor, x_origin - x_origin * x_factor, y_origin - y_origin * y_factor
+
+
+def _rotate_matrix(angle: float, x_origin: float = 0.0, y_origin: float = 0.0) -> Tuple[float, ...]:
+    """
+    Return the (a, b, d, e, xoff, yoff) affine matrix of a counter-clockwise rotation around an origin.
+
+    Parameters
+    ----------
+    angle : float
+        The rotation angle in degrees.
+    x_origin : float, optional
+        The x coordinate of the rotation center, by default 0.
+    y_origin : float, optional
+        The y coordinate of the rotation center, by default 0.
+
+    Returns
+    -------
+    tuple of float
+        The affine matrix, in the coefficient order of ``shapely.affinity.affine_transform``.
+    """
+    angle = math.radians(angle)
+    cos, sin = math.cos(angle), math.sin(angle)
+
+    # Same rounding as shapely.affinity.rotate, so that quarter turns stay exact
+    cos = 0.0 if abs(cos) < 2.5e-16 else cos
+    sin = 0.0 if abs(sin) < 2.5e-16 else sin
+
+    return cos, -sin, sin, cos, x_origin - x_origin * cos + y_origin * sin, y_origin - x_origin * sin - y_origin * cos
+
+
+def _affine_transform_coordinates(coordinates: np.ndarray, matrix: Tuple[float, ...]) -> np.ndarray:
+    """
+    Apply a 2D affine matrix to a (N, 2) array of coordinates.
+
+    Parameters
+    ----------
+    coordinates : numpy.ndarray
+        The (N, 2) array of the (x, y) coordinates.
+    matrix : tuple of float
+        The (a, b, d, e, xoff, yoff) affine matrix.
+
+    Returns
+    -------
+    numpy.ndarray
+        The (N, 2) array of the transformed coordinates.
+    """
+    a, b, d, e, x_offset, y_offset = matrix
+
+    # A pure translation (the most frequent transform) is a single broadcast addition
+    if (a, b, d, e) == (1, 0, 0, 1):
+        return coordinates + np.array((x_offset, y_offset), dtype=np.float64)
+
+    # Element-wise rather than a matmul, for the same robustness reasons as shapely.affinity.affine_transform
+    x, y = coordinates[:, 0], coordinates[:, 1]
+    return np.column_stack((a * x + b * y + x_offset, d * x + e * y + y_offset))
+
+
+def _affine_transform(geometries, matrix: Tuple[float, ...]):
+    """
+    Apply a 2D affine matrix to one geometry or an array of geometries in a single vectorized call.
+
+    Parameters
+    ----------
+    geometries : shapely.geometry or array_like of shapely.geometry
+        The geometries to transform.
+    matrix : tuple of float
+        The (a, b, d, e, xoff, yoff) affine matrix.
+
+    Returns
+    -------
+    shapely.geometry or numpy.ndarray
+        The transformed geometries, with the same shape as the input.
+    """
+    return shapely.transform(geometries, lambda coordinates: _affine_transform_coordinates(coordinates, matrix))
+
+
+def transform_geometries(geometries: Iterable['Alteration'], matrix: Tuple[float, ...]) -> None:
+    """
+    Apply the same affine matrix in place to several geometries, in a single vectorized call.
+
+    Parameters
+    ----------
+    geometries : iterable of Alteration
+        The geometries to transform.
+    matrix : tuple of float
+        The (a, b, d, e, xoff, yoff) affine matrix, e.g. from :func:`_rotate_matrix`.
+    """
+    geometries = list(geometries)
+    if not geometries:
+        return
+
+    shapely_objects = np.empty(len(geometries), dtype=object)
+    shapely_objects[:] = [geometry._shapely_object for geometry in geometries]
+
+    for geometry, shapely_object in zip(geometries, _affine_transform(shapely_objects, matrix)):
+        geometry._shapely_object = shapely_object
+
+
+def _interpret_origin(origin) -> Tuple[float, float]:
+    """
+    Return the (x, y) coordinates of a transformation origin, without building a Point for the default (0, 0).
+    """
+    if isinstance(origin, tuple) and origin == (0, 0):
+        return 0.0, 0.0
+
+    return tuple(ff.components.utils.interpret_to_point(origin)._xy.tolist())
+
+
+def _copy_attribute(value):
+    """
+    Copy an attribute for :meth:`Alteration.copy`, recursing into lists, tuples, dicts and sets.
+
+    Alteration instances are copied with their own ``copy`` method, any other value is shared.
+    """
+    if isinstance(value, Alteration):
+        return value.copy()
+
+    if isinstance(value, (list, set)):
+        return type(value)(_copy_attribute(element) for element in value)
+
+    if isinstance(value, tuple):
+        elements = [_copy_attribute(element) for element in value]
+        # Tuples without any Alteration inside (e.g. cache keys) are immutable and kept as they are
+        if all(copied is element for copied, element in zip(elements, value)):
+            return value
+        return type(value)(*elements) if hasattr(value, '_fields') else type(value)(elements)
+
+    if isinstance(value, dict):
+        return type(value)((key, _copy_attribute(element)) for key, element in value.items())
+
+    return value
+
+
+def in_place_copy(function: Callable) -> Callable:
+    """
+    Decorator to manage in-place operations.
+
+    Parameters
+    ----------
+    function : Callable
+        The function to wrap.
+
+    Returns
+    -------
+    Callable
+        Wrapped function that optionally modifies the object in-place.
+    """
+    @functools.wraps(function)
+    def wrapper(self, *args, in_place=False, **kwargs):
+        instance = self if in_place else self.copy()
+        return function(self, instance, *args, **kwargs)
+
+    return wrapper
+
+
 class Alteration:
-    def in_place_copy(function: Callable) -> Callable:
+    def copy(self) -> 'Alteration':
         """
-        Decorator to manage in-place operations.
+        Create an independent copy of the object.
 
-        Parameters
-        ----------
-        function : Callable
-            The function to wrap.
+        Shapely geometries are immutable, so they are shared with the copy rather than deep-copied.
+        Nested Alteration attributes (e.g. the core of a Circle) are copied the same way, also when they
+        are held in a list, tuple, dict or set, so in-place operations on the copy never affect the original.
 
         Returns
         -------
-        Callable
-            Wrapped function that optionally modifies the object in-place.
+        Alteration
+            A new instance independent from the current object.
         """
-        def wrapper(self, *args, in_place=False, **kwargs):
-            instance = self if in_place else self.copy()
-            return function(self, instance, *args, **kwargs)
+        output = object.__new__(type(self))
 
-        return wrapper
+        for key, value in self.__dict__.items():
+            output.__dict__[key] = _copy_attribute(value)
 
-    def copy(self) -> 'Alteration':
+        return output
+
+    def __deepcopy__(self, memo: dict) -> 'Alteration':
         """
-        Create a deep copy of the object.
+        Create a deep copy of the object for ``copy.deepcopy``.
+
+        Shapely geometries are immutable, so they are shared rather than serialized and rebuilt through GEOS;
+        every other attribute is deep-copied as usual.
+
+        Parameters
+        ----------
+        memo : dict
+            The memo dictionary of the ongoing deepcopy.
 
         Returns
         -------
         Alteration
-            A new instance that is a deep copy of the current object.
+            A new instance independent from the current object.
         """
-        return copy.deepcopy(self)
+        output = object.__new__(type(self))
+        memo[id(self)] = output
+
+        for key, value in self.__dict__.items():
+            output.__dict__[key] = value if isinstance(value, shapely.Geometry) else copy.deepcopy(value, memo)
+
+        return output
 
     def __repr__(self) -> str:
         """
@@ -83,8 +439,19 @@ class Alteration:
         Alteration
             The union of the geometries.
         """
-        other_shapes = (o._shapely_object for o in others)
-        output._shapely_object = self._shapely_object.union(*other_shapes)
+        other_shapes = [o._shapely_object for o in others]
+
+        if _are_squares(self, *others):
+            rectangle = _fast_union(self._shapely_object, *other_shapes)
+            if rectangle is not None:
+                output._shapely_object = rectangle
+                return output
+
+        # Geometry.union takes a single operand, several are merged together in one GEOS call
+        if len(other_shapes) == 1:
+            output._shapely_object = self._shapely_object.union(other_shapes[0])
+        else:
+            output._shapely_object = shapely.union_all([self._shapely_object, *other_shapes])
         return output
 
     @in_place_copy
@@ -104,8 +471,19 @@ class Alteration:
         Alteration
             The intersection of the geometries.
         """
-        other_shapes = (o._shapely_object for o in others)
-        output._shapely_object = self._shapely_object.intersection(*other_shapes)
+        other_shapes = [o._shapely_object for o in others]
+
+        if _are_squares(self, *others):
+            rectangle = _fast_intersection(self._shapely_object, *other_shapes)
+            if rectangle is not None:
+                output._shapely_object = rectangle
+                return output
+
+        # Geometry.intersection takes a single operand, several are intersected together in one GEOS call
+        if len(other_shapes) == 1:
+            output._shapely_object = self._shapely_object.intersection(other_shapes[0])
+        else:
+            output._shapely_object = shapely.intersection_all([self._shapely_object, *other_shapes])
         return output
 
     @in_place_copy
@@ -127,8 +505,8 @@ class Alteration:
         Alteration
             The scaled geometry.
         """
-        origin_point = ff.components.utils.interpret_to_point(origin)
-        output._shapely_object = affinity.scale(self._shapely_object, xfact=factor, yfact=factor, origin=origin_point._shapely_object)
+        x_origin, y_origin = _interpret_origin(origin)
+        output._shapely_object = _affine_transform(self._shapely_object, _scale_matrix(factor, factor, x_origin, y_origin))
         return output
 
     @in_place_copy
@@ -148,8 +526,8 @@ class Alteration:
         Alteration
             The translated geometry.
         """
-        shift_point = ff.components.utils.interpret_to_point(shift)
-        output._shapely_object = affinity.translate(self._shapely_object, shift_point.x, shift_point.y)
+        x_offset, y_offset = ff.components.utils.interpret_to_point(shift)._xy
+        output._shapely_object = _affine_transform(self._shapely_object, _translate_matrix(x_offset, y_offset))
         return output
 
     @in_place_copy
@@ -171,12 +549,50 @@ class Alteration:
         Alteration
             The rotated geometry.
         """
-        origin_point = ff.components.utils.interpret_to_point(origin)
-        output._shapely_object = affinity.rotate(self._shapely_object, angle=angle, origin=origin_point._shapely_object)
+        x_origin, y_origin = _interpret_origin(origin)
+        output._shapely_object = _affine_transform(self._shapely_object, _rotate_matrix(angle, x_origin, y_origin))
+        return output
+
+    @in_place_copy
+    def transform(self, output, matrix: Tuple[float, ...]) -> 'Alteration':
+        """
+        Apply a 2D affine transformation to the geometry.
+
+        Parameters
+        ----------
+        output : Alteration
+            The object to store the result.
+        matrix : tuple of float
+            The (a, b, d, e, xoff, yoff) affine matrix, in the coefficient order of
+            ``shapely.affinity.affine_transform``.
+
+        Returns
+        -------
+        Alteration
+            The transformed geometry.
+        """
+        output._shapely_object = _affine_transform(self._shapely_object, matrix)
         return output
 
 
 class BaseArea(Alteration):
+    def _get_property_cache(self) -> dict:
+        """
+        Return the cache of the derived shapely properties (area, bounds, centroid).
+
+        The cache is rebuilt whenever the shapely object is replaced, which is how every operation mutates a shape.
+
+        Returns
+        -------
+        dict
+            The cached properties computed so far for the current shapely object.
+        """
+        if getattr(self, '_property_cache_source', None) is not self._shapely_object:
+            self._property_cache = {}
+            self._property_cache_source = self._shapely_object
+
+        return self._property_cache
+
     @property
     def is_iterable(self) -> bool:
         """
@@ -251,9 +667,8 @@ class BaseArea(Alteration):
         numpy.ndarray
             The rasterized shape as a mesh.
         """
-        raster = self.rasterize(coordinate_system=coordinate_system)
-        raster = raster.reshape(coordinate_system.shape)
-        return raster.astype(np.float64)
+        # The raster is produced in float64 directly, without an int8 intermediate to reshape and cast
+        return self.rasterize(coordinate_system=coordinate_system, dtype=np.float64)
 
     @property
     def convex_hull(self) -> geo.Polygon:
@@ -277,7 +692,10 @@ class BaseArea(Alteration):
         float
             The area of the shape.
         """
-        return self._shapely_object.area
+        cache = self._get_property_cache()
+        if 'area' not in cache:
+            cache['area'] = self._shapely_object.area
+        return cache['area']
 
     @property
     def bounds(self) -> Tuple[float, float, float, float]:
@@ -289,7 +707,10 @@ class BaseArea(Alteration):
         tuple of float
             The (minx, miny, maxx, maxy) bounds of the shape.
         """
-        return self._shapely_object.bounds
+        cache = self._get_property_cache()
+        if 'bounds' not in cache:
+            cache['bounds'] = self._shapely_object.bounds
+        return cache['bounds']
 
     @property
     def center(self) -> geo.Point:
@@ -301,7 +722,24 @@ class BaseArea(Alteration):
         Point
             The centroid of the shape as a Point.
         """
-        return ff.Point(position=(self._shapely_object.centroid.x, self._shapely_object.centroid.y))
+        # A new Point is returned each time since callers may alter it in place
+        return ff.Point._from_xy(*self._get_center_xy())
+
+    def _get_center_xy(self) -> Tuple[float, float]:
+        """
+        Get the (x, y) coordinates of the centroid, for internal callers that do not need a Point.
+
+        Returns
+        -------
+        tuple of float
+            The cached centroid coordinates.
+        """
+        cache = self._get_property_cache()
+        if 'centroid' not in cache:
+            centroid = self._shapely_object.centroid
+            cache['centroid'] = (centroid.x, centroid.y)
+
+        return cache['centroid']
 
     def __add__(self, other: 'BaseArea') -> 'BaseArea':
         """
@@ -318,7 +756,9 @@ class BaseArea(Alteration):
             The union of the two geometries.
         """
         output = self.copy()
-        output._shapely_object = self._shapely_object.union(other._shapely_object)
+
+        rectangle = _fast_union(self._shapely_object, other._shapely_object) if _are_squares(self, other) else None
+        output._shapely_object = rectangle if rectangle is not None else self._shapely_object.union(other._shapely_object)
         return output
 
     def __sub__(self, other: 'BaseArea', tolerance: float = 1e-9) -> 'BaseArea':
@@ -361,7 +801,9 @@ class BaseArea(Alteration):
             The intersection of the two geometries.
         """
         output = self.copy()
-        output._shapely_object = self._shapely_object.intersection(other._shapely_object)
+
+        rectangle = _fast_intersection(self._shapely_object, other._shapely_object) if _are_squares(self, other) else None
+        output._shapely_object = rectangle if rectangle is not None else self._shapely_object.intersection(other._shapely_object)
         return output
 
     def scale_position(self, factor: float) -> 'BaseArea':
@@ -378,14 +820,9 @@ class BaseArea(Alteration):
         BaseArea
             The scaled shape.
         """
-        new_position = affinity.scale(
-            self.center._shapely_object,
-            xfact=factor,
-            yfact=factor,
-            origin=(0, 0)
-        )
-
-        shift = (new_position.x - self.center.x, new_position.y - self.center.y)
+        # Scaling the center around the origin moves it by center * (factor - 1)
+        x, y = self._get_center_xy()
+        shift = (x * (factor - 1), y * (factor - 1))
 
         self.core.translate(shift=shift, in_place=True)
         self.translate(shift=shift, in_place=True)
@@ -435,8 +872,7 @@ class BaseArea(Alteration):
         if not self.is_pure_polygon:
             raise ValueError(f"Error: expected a pure polygon, but got {self._shapely_object.__class__}.")
 
-        split_geometry = split(self._shapely_object, line.copy().extend(factor=100)._shapely_object).geoms
-        areas = [poly.area for poly in split_geometry]
-        idx = np.argmax(areas) if return_largest else np.argmin(areas)
+        split_geometry = shapely.get_parts(split(self._shapely_object, line._get_extended_geometry(factor=100)))
+        areas = shapely.area(split_geometry)
 
-        return ff.Polygon(instance=split_geometry[idx])
+        return ff.Polygon(instance=split_geometry[areas.argmax() if return_largest else areas.argmin()])
@@ -1,14 +1,16 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import math
 from typing import Optional, Tuple
 import numpy as np
 from pydantic.dataclasses import dataclass
 from dataclasses import field
 from pydantic import ConfigDict
+import shapely
 from shapely.affinity import scale
 import shapely.geometry as geo
-from FiberFusing.components.base_class import Alteration
+from FiberFusing.components.base_class import Alteration, _affine_transform, _translate_matrix
 import FiberFusing as ff
 
 
@@ -30,29 +32,78 @@ class LineString(Alteration):
         else:
             if len(self.coordinates) != 2:
                 raise ValueError('LineString must be initialized with exactly two coordinate pairs.')
-            _coordinates = (self.coordinates[0]._shapely_object, self.coordinates[1]._shapely_object)
-            self._shapely_object = geo.LineString(_coordinates)
+            # Built from the point coordinates, so the shapely points of the ends are never materialized
+            self._shapely_object = shapely.linestrings([(point.x, point.y) for point in self.coordinates])
+
+    @classmethod
+    def from_xy(cls, x0: float, y0: float, x1: float, y1: float) -> 'LineString':
+        """
+        Creates a straight LineString between (x0, y0) and (x1, y1), without building the end Points.
+        """
+        return cls._from_geometry(shapely.linestrings([(x0, y0), (x1, y1)]))
+
+    @classmethod
+    def _from_geometry(cls, geometry: geo.LineString) -> 'LineString':
+        """
+        Creates a LineString wrapping a shapely line string, skipping the dataclass validation.
+        """
+        line = object.__new__(cls)
+        line.__dict__.update(coordinates=None, instance=geometry, index=None)
+        line._shapely_object = geometry
+        return line
+
+    def _get_cache(self) -> dict:
+        """ Returns the end points (as an array and as x0, y0, x1, y1 floats), mid point and length, computed once until the shapely object is replaced. """
+        if getattr(self, '_cache_source', None) is not self._shapely_object:
+            coordinates = np.asarray(self._shapely_object.coords, dtype=np.float64)
+            endpoints = coordinates[[0, -1]]
+
+            # The length of a two-point line is the distance between its end points, no GEOS call needed
+            if len(coordinates) == 2:
+                (x0, y0), (x1, y1) = coordinates.tolist()
+                length = math.hypot(x1 - x0, y1 - y0)
+            else:
+                length = self._shapely_object.length
+
+            self._cache = dict(
+                xy=tuple(endpoints.ravel().tolist()),
+                endpoints=endpoints,
+                mid_point=endpoints.mean(axis=0),
+                length=length,
+            )
+            self._cache_source = self._shapely_object
+        return self._cache
 
     @property
     def boundary(self) -> Tuple[geo.Point, geo.Point]:
         """ Returns the boundary points of the line string as a tuple of Shapely Point objects. """
-        return self._shapely_object.boundary.geoms
+        cache = self._get_cache()
+        if 'boundary' not in cache:
+            cache['boundary'] = tuple(self._shapely_object.boundary.geoms)
+        return cache['boundary']
+
+    @property
+    def endpoints(self) -> np.ndarray:
+        """ Returns the (2, 2) array of the end points, cached until the shapely object is replaced. """
+        return self._get_cache()['endpoints']
 
     @property
     def center(self) -> geo.Point:
         """ Returns the centroid of the line as a Shapely Point object. """
-        return self._shapely_object.centroid
+        cache = self._get_cache()
+        if 'center' not in cache:
+            cache['center'] = self._shapely_object.centroid
+        return cache['center']
 
     @property
     def mid_point(self) -> ff.Point:
         """ Returns the midpoint of the line string as a Shapely Point object. """
-        P0, P1 = self.boundary
-        return ff.Point(position=[(P0.x + P1.x) / 2, (P0.y + P1.y) / 2])
+        return ff.Point._from_array(self._get_cache()['mid_point'])
 
     @property
     def length(self) -> float:
         """ Returns the length of the line string. """
-        return self._shapely_object.length
+        return self._get_cache()['length']
 
     def intersect(self, other: 'LineString') -> None:
         """ Intersects this line string with another, updating the shapely object in place. """
@@ -60,18 +111,14 @@ class LineString(Alteration):
 
     def get_perpendicular(self) -> 'LineString':
         """ Returns a new LineString object that is perpendicular to this one. """
-        mid = self.mid_point
-        p0, p1 = self.boundary
-        dx, dy = p1.x - p0.x, p1.y - p0.y
-        new_coords = ff.Point(position=(mid.x - dy, mid.y + dx)), ff.Point(position=(mid.x + dy, mid.y - dx))
-        return LineString(coordinates=new_coords)
+        x0, y0, x1, y1 = self._get_cache()['xy']
+        mid_x, mid_y, dx, dy = (x0 + x1) / 2, (y0 + y1) / 2, x1 - x0, y1 - y0
+        return LineString.from_xy(mid_x - dy, mid_y + dx, mid_x + dy, mid_y - dx)
 
     def get_position_parametrization(self, t: float) -> ff.Point:
         """ Returns the point at parameter t along the line. 0 <= t <= 1. """
-        p0, p1 = self.boundary
-        x = p0.x * (1 - t) + p1.x * t
-        y = p0.y * (1 - t) + p1.y * t
-        return ff.Point(position=(x, y))
+        x0, y0, x1, y1 = self._get_cache()['xy']
+        return ff.Point._from_xy(x0 * (1 - t) + x1 * t, y0 * (1 - t) + y1 * t)
 
     def render_on_axis(self, ax, **kwargs) -> None:
         """ Renders the line string on a given matplotlib axis. """
@@ -84,23 +131,32 @@ class LineString(Alteration):
 
     def centering(self, center: geo.Point) -> 'LineString':
         """ Centers the line string at a given point. """
-        p0, p1 = self.boundary
-        mid = self.mid_point
-        dx, dy = center.x - mid.x, center.y - mid.y
-        new_coords = [(p.x + dx, p.y + dy) for p in [p0, p1]]
-        new_coords = ff.Point(position=new_coords[0]), ff.Point(position=new_coords[1])
-        return LineString(coordinates=tuple(new_coords))
+        x0, y0, x1, y1 = self._get_cache()['xy']
+        mid_x, mid_y = (x0 + x1) / 2, (y0 + y1) / 2
+        output = self.copy()
+        output._shapely_object = _affine_transform(self._shapely_object, _translate_matrix(center.x - mid_x, center.y - mid_y))
+        return output
 
     def get_vector(self) -> np.ndarray:
         """ Returns a unit vector representing the direction of the line string. """
-        p0, p1 = self.boundary
-        dx, dy = p1.x - p0.x, p1.y - p0.y
-        norm = np.sqrt(dx**2 + dy**2)
-        return np.array([dx, dy]) / norm if norm != 0 else np.array([0, 0])
+        x0, y0, x1, y1 = self._get_cache()['xy']
+        dx, dy = x1 - x0, y1 - y0
+        norm = math.hypot(dx, dy)
+        return np.array([dx / norm, dy / norm]) if norm != 0 else np.array([0, 0])
+
+    def _get_extended_geometry(self, factor: float) -> geo.LineString:
+        """ Returns the shapely line string scaled by the specified factor around its center. """
+        # A two-point line is scaled around its mid point directly, without an affine transform
+        if shapely.get_num_coordinates(self._shapely_object) == 2:
+            mid_point = self._get_cache()['mid_point']
+            return shapely.linestrings(mid_point + factor * (self.endpoints - mid_point))
+
+        return scale(self._shapely_object, xfact=factor, yfact=factor, origin='center')
 
     def extend(self, factor: float = 1) -> 'LineString':
         """ Returns a new LineString scaled by the specified factor. """
-        scaled_string = scale(self._shapely_object, xfact=factor, yfact=factor, origin='center')
-        return LineString(instance=scaled_string)
+        output = self.copy()
+        output._shapely_object = self._get_extended_geometry(factor)
+        return output
 
 # -
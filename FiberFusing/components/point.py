@@ -2,16 +2,33 @@
 # -*- coding: utf-8 -*-
 
 # Built-in imports
+import math
 from typing import Optional, Tuple
 import numpy
 from pydantic.dataclasses import dataclass
 from pydantic import ConfigDict
 from FiberFusing.components.base_class import Alteration
 import shapely.geometry as geo
-import matplotlib.pyplot as plt
+from typing import TYPE_CHECKING
 import FiberFusing as ff
 from FiberFusing.helper import _plot_helper
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+
+def _as_xy(other) -> numpy.ndarray:
+    """
+    Returns the (2,) float64 coordinates of a Point or of a plain (x, y) pair, without building a Point.
+    """
+    if isinstance(other, Point):
+        return other._xy
+
+    if isinstance(other, (tuple, list, numpy.ndarray)) and len(other) == 2:
+        return numpy.array((other[0], other[1]), dtype=numpy.float64)
+
+    return ff.components.utils.interpret_to_point(other)._xy
+
 
 @dataclass(config=ConfigDict(extra='forbid', arbitrary_types_allowed=True))
 class Point(Alteration):
@@ -26,62 +43,97 @@ class Point(Alteration):
         if (self.position is None) == (self.instance is None):
             raise ValueError("Point must be instantiated with either 'position' or 'instance', not both.")
 
-        self._shapely_object = self.instance if self.instance is not None else geo.Point(self.position)
+        if self.instance is not None:
+            self._shapely_object = self.instance
+        else:
+            self._xy = numpy.asarray(self.position, dtype=numpy.float64)
+            self._geometry = None
+
+    @classmethod
+    def _from_xy(cls, x: float, y: float) -> 'Point':
+        """
+        Creates a Point directly from its coordinates, skipping the dataclass validation and the
+        shapely construction.
+        """
+        return cls._from_array(numpy.array((x, y), dtype=numpy.float64))
+
+    @classmethod
+    def _from_array(cls, xy: numpy.ndarray) -> 'Point':
+        """
+        Creates a Point from a (2,) float64 array, which is kept (not copied) as the coordinates.
+        """
+        point = object.__new__(cls)
+        point.__dict__.update(
+            position=tuple(xy.tolist()),
+            instance=None,
+            index=None,
+            _xy=xy,
+            _geometry=None
+        )
+        return point
+
+    @property
+    def _shapely_object(self) -> geo.Point:
+        """Returns the shapely Point, materialized from the coordinates on first access."""
+        if self._geometry is None:
+            self._geometry = geo.Point(self._xy)
+        return self._geometry
+
+    @_shapely_object.setter
+    def _shapely_object(self, geometry: geo.Point) -> None:
+        self._geometry = geometry
+        self._xy = numpy.array((geometry.x, geometry.y), dtype=numpy.float64)
 
     @property
     def x(self) -> float:
         """Returns the x-coordinate of the point."""
-        return self._shapely_object.x
+        return float(self._xy[0])
 
     @property
     def y(self) -> float:
         """Returns the y-coordinate of the point."""
-        return self._shapely_object.y
+        return float(self._xy[1])
 
     def shift_position(self, shift: Tuple[float, float]) -> 'Point':
         """
         Shifts the point by a given offset and returns a new Point instance.
         """
-        point_shift = ff.components.utils.interpret_to_point(shift)
-        return self.__add__(point_shift)
+        return Point._from_array(self._xy + _as_xy(shift))
 
     def __add__(self, other) -> 'Point':
         """
         Adds the coordinates of another point to this one and returns a new Point instance.
         """
-        other = ff.components.utils.interpret_to_point(other)
-
-        return Point(position=(self.x + other.x, self.y + other.y))
+        return Point._from_array(self._xy + _as_xy(other))
 
     def __sub__(self, other) -> 'Point':
         """
         Subtracts the coordinates of another point from this one and returns a new Point instance.
         """
-        other = ff.components.utils.interpret_to_point(other)
-        return Point(position=(self.x - other.x, self.y - other.y))
+        return Point._from_array(self._xy - _as_xy(other))
 
     def __neg__(self) -> 'Point':
         """
         Negates the coordinates of this point and returns a new Point instance.
         """
-        return Point(position=[-self.x, -self.y])
+        return Point._from_array(-self._xy)
 
     def __mul__(self, factor: float) -> 'Point':
         """
         Multiplies the coordinates of this point by a scalar and returns a new Point instance.
         """
-        return Point(position=[self.x * factor, self.y * factor])
+        return Point._from_array(self._xy * factor)
 
     def distance(self, other: 'Point') -> float:
         """
         Computes the Euclidean distance between this point and another point.
         """
-        return numpy.sqrt((self.x - other.x)**2 + (self.y - other.y)**2)
+        return math.hypot(self.x - other.x, self.y - other.y)
 
     @_plot_helper
     def plot(
             self,
-            ax: plt.Axes = None,
+            ax: "plt.Axes" = None,
             marker: str = 'x',
             size: int = 20,
             label: str = None) -> None:
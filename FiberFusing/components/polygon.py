@@ -2,16 +2,19 @@
 # -*- coding: utf-8 -*-
 
 import numpy as np
-from typing import Iterable, List, Optional, Union, Tuple
-from matplotlib.path import Path
+from typing import Iterable, List, Optional, Union, Tuple, TYPE_CHECKING
+import shapely
 import shapely.geometry as geo
-import matplotlib.pyplot as plt
 from FiberFusing.coordinate_system import CoordinateSystem
 from FiberFusing.components.base_class import BaseArea
 from FiberFusing.plottings import plot_polygon
+from FiberFusing import rasterization
 from pydantic import ConfigDict
 from FiberFusing.helper import _plot_helper
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
 config = ConfigDict(extra='forbid', arbitrary_types_allowed=True, kw_only=True)
 
 
@@ -43,12 +46,59 @@ class Polygon(BaseArea):
             raise ValueError('Polygon must be initialized with either coordinates or an instance')
 
         if coordinates is not None:
-            self._shapely_object = geo.Polygon(coordinates)
+            self._shapely_object = shapely.polygons(np.asarray(coordinates, dtype=np.float64))
         else:
             self._shapely_object = instance
 
         self.index = index
 
+    @classmethod
+    def from_arrays(cls, xy: np.ndarray, index: Optional[float] = None) -> 'Polygon':
+        """
+        Creates a polygon from an array of exterior coordinates, built in a single vectorized call.
+
+        Parameters
+        ----------
+        xy : np.ndarray
+            A (N, 2) array of the (x, y) coordinates of the exterior ring.
+        index : float, optional
+            An optional numerical index associated with the polygon.
+
+        Returns
+        -------
+        Polygon
+            The new polygon.
+        """
+        return cls(instance=shapely.polygons(np.asarray(xy, dtype=np.float64)), index=index)
+
+    @classmethod
+    def from_coordinates_batch(cls, coordinates_list: List[np.ndarray], index: Optional[float] = None) -> List['Polygon']:
+        """
+        Creates several polygons from their exterior coordinates, all built in a single vectorized call.
+
+        Parameters
+        ----------
+        coordinates_list : list of np.ndarray
+            The (N, 2) arrays of the (x, y) coordinates of each exterior ring, N may differ between polygons.
+        index : float, optional
+            An optional numerical index associated with every polygon.
+
+        Returns
+        -------
+        list of Polygon
+            The new polygons, in the order of the coordinates.
+        """
+        coordinates_list = [np.asarray(xy, dtype=np.float64) for xy in coordinates_list]
+
+        if not coordinates_list:
+            return []
+
+        # Rings of different lengths are stacked and told apart by the index of the polygon they belong to
+        ring_index = np.repeat(np.arange(len(coordinates_list)), [len(xy) for xy in coordinates_list])
+        rings = shapely.linearrings(np.concatenate(coordinates_list), indices=ring_index)
+
+        return [cls(instance=polygon, index=index) for polygon in shapely.polygons(rings)]
+
     @property
     def interiors(self):
         """
@@ -73,16 +123,33 @@ class Polygon(BaseArea):
         if isinstance(self._shapely_object, geo.MultiPolygon):
             return EmptyPolygon()
 
-        output = self.copy()
+        # The first ring is the exterior, the others are the holes
+        interiors = shapely.get_rings(self._shapely_object)[1:]
 
-        if isinstance(output.interiors, Iterable):
-            from FiberFusing.components.utils import get_polygon_union
-            polygons = [geo.Polygon(c) for c in output.interiors]
-            output = get_polygon_union(*polygons)
-        else:
-            output._shapely_object = geo.Polygon(*output.interiors)
+        if len(interiors) == 0:
+            return Polygon(instance=geo.Polygon())
 
-        return output
+        # The common single-hole case is a plain Polygon
+        if len(interiors) == 1:
+            return Polygon(instance=shapely.polygons(interiors[0]))
+
+        # The holes of a valid polygon never overlap, so they form a MultiPolygon without any overlay
+        return Polygon(instance=shapely.multipolygons(shapely.polygons(interiors)))
+
+    def _get_edges(self) -> np.ndarray:
+        """
+        Returns the edges of every ring of the polygon, cached until the shapely object is replaced.
+
+        Returns
+        -------
+        np.ndarray
+            A (M, 4) array where each row is an edge (x0, y0, x1, y1).
+        """
+        if getattr(self, '_edges_source', None) is not self._shapely_object:
+            self._edges = rasterization.get_polygon_edges(self._shapely_object)
+            self._edges_source = self._shapely_object
+
+        return self._edges
 
     def contains_points(self, coordinates: np.ndarray) -> np.ndarray:
         """
@@ -100,51 +167,30 @@ class Polygon(BaseArea):
             A boolean array where True indicates that the coordinate is inside the polygon
             or multipolygon (excluding any holes) and False indicates that it is outside or within a hole.
         """
-        inclusion_mask = np.zeros(coordinates.shape[0], dtype=bool)
-
-        if isinstance(self._shapely_object, geo.MultiPolygon):
-            for polygon in self._shapely_object.geoms:
-                inclusion_mask |= self._contain_points_with_holes(coordinates=coordinates, polygon=polygon)
-        elif isinstance(self._shapely_object, geo.Polygon):
-            inclusion_mask = self._contain_points_with_holes(coordinates=coordinates, polygon=self._shapely_object)
-        else:
+        if not isinstance(self._shapely_object, (geo.Polygon, geo.MultiPolygon)):
             raise TypeError("Input geometry must be a Polygon or MultiPolygon.")
 
-        return inclusion_mask
+        x, y = coordinates[:, 0], coordinates[:, 1]
 
-    def _contain_points_with_holes(self, coordinates: np.ndarray, polygon: geo.Polygon) -> np.ndarray:
-        """
-        Determines if the given coordinates are contained within the exterior of the specified polygon,
-        excluding any points that fall inside the holes (interiors).
-
-        Parameters
-        ----------
-        coordinates : np.ndarray
-            An array of 2D coordinates, where each row represents a point (x, y).
-        polygon : geo.Polygon
-            A Shapely Polygon object whose exterior and interiors will be used to test point containment.
+        # Only the points inside the bounding box go through the point-in-polygon test
+        min_x, min_y, max_x, max_y = self.bounds
+        in_bounds = np.logical_and.reduce([x >= min_x, x <= max_x, y >= min_y, y <= max_y])
 
-        Returns
-        -------
-        np.ndarray
-            A boolean array where each element is True if the corresponding coordinate is inside
-            the polygon's exterior but not inside any of its holes, and False otherwise.
-        """
-        # Create a Matplotlib Path object from the polygon's exterior coordinates
-        path_exterior = Path(np.array(polygon.exterior.coords))
-        exterior_mask = path_exterior.contains_points(coordinates)
+        output = np.zeros(coordinates.shape[0], dtype=bool)
 
-        # If the polygon has interiors (holes), check if any points fall inside them
-        hole_mask = np.zeros(coordinates.shape[0], dtype=bool)
-        for interior in polygon.interiors:
-            path_hole = Path(np.array(interior.coords))
-            hole_mask |= path_hole.contains_points(coordinates)
+        # The crossing-number kernel wins on small polygons, GEOS on finely discretized ones (e.g. circles)
+        if rasterization.numba is not None:
+            edges = self._get_edges()
+            if edges.shape[0] <= rasterization.CONTAINS_POINTS_MAX_EDGES:
+                output[in_bounds] = rasterization.contains_points(edges, coordinates[in_bounds])
+                return output
 
-        # Points are inside if they are in the exterior but not in any hole
-        return exterior_mask & ~hole_mask
+        # GEOS handles the holes and the MultiPolygon members in a single vectorized call
+        output[in_bounds] = shapely.contains_xy(self._shapely_object, x[in_bounds], y[in_bounds])
+        return output
 
     @_plot_helper
-    def plot(self, ax: plt.Axes, **kwargs) -> None:
+    def plot(self, ax: "plt.Axes", **kwargs) -> None:
         """
         Plots the polygon on the given Matplotlib axis.
 
@@ -157,7 +203,7 @@ class Polygon(BaseArea):
         """
         plot_polygon(ax=ax, polygon=self._shapely_object, **kwargs)
 
-    def rasterize(self, coordinate_system: CoordinateSystem) -> np.ndarray:
+    def rasterize(self, coordinate_system: CoordinateSystem, dtype: type = np.int8) -> np.ndarray:
         """
         Rasterizes the polygon to a grid based on a coordinate system.
 
@@ -165,24 +211,16 @@ class Polygon(BaseArea):
         ----------
         coordinate_system : CoordinateSystem
             The coordinate system used for rasterization.
+        dtype : type, optional
+            The data type of the raster. Default is int8.
 
         Returns
         -------
         np.ndarray
             A 2D array where 1 indicates the presence of the polygon and 0 indicates its absence.
         """
-        unstructured_coordinates = coordinate_system.to_unstructured_coordinate()
-        exterior_mask = self.contains_points(unstructured_coordinates)
-        hole = self.get_hole()
-        hole_mask = np.zeros(exterior_mask.shape, dtype=bool)
-
-        if isinstance(hole, Iterable):
-            for sub_hole in hole.geoms:
-                hole_mask |= sub_hole.contains_points(unstructured_coordinates)
-        elif not hole.is_empty:
-            hole_mask = hole.contains_points(unstructured_coordinates)
-
-        return np.where(exterior_mask & ~hole_mask, 1, 0).reshape(coordinate_system.shape)
+        # Scanline fill of the structured grid, with the numba kernel or its NumPy counterpart
+        return rasterization.scanline_rasterize(self._shapely_object, coordinate_system, dtype=dtype, edges=self._get_edges())
 
     def remove_non_polygon_elements(self) -> 'Polygon':
         """
@@ -214,8 +252,9 @@ class Polygon(BaseArea):
             The instance of this class with the largest polygon retained.
         """
         if isinstance(self._shapely_object, geo.MultiPolygon):
-            largest_polygon = max(self._shapely_object.geoms, key=lambda poly: poly.area)
-            self._shapely_object = largest_polygon
+            # All the areas are computed in a single vectorized call
+            polygons = shapely.get_parts(self._shapely_object)
+            self._shapely_object = polygons[shapely.area(polygons).argmax()]
         return self
 
 
@@ -2,10 +2,14 @@
 # -*- coding: utf-8 -*-
 
 from typing import Iterable, Union, List
+from FiberFusing.components.base_class import Alteration
 from FiberFusing.components.point import Point
 from FiberFusing.components.polygon import Polygon
+from FiberFusing.coordinate_system import CoordinateSystem
+from FiberFusing import rasterization
+import numpy
+import shapely
 import shapely.geometry as geo
-from shapely.ops import unary_union
 
 
 def get_polygon_union(*objects) -> Polygon:
@@ -14,7 +18,7 @@ def get_polygon_union(*objects) -> Polygon:
 
     Args:
         objects: Variable length argument list of geometric objects.
-                 Each object can be a shapely geometry object or an instance with a `_shapely_object` attribute.
+                 Each object can be a shapely geometry object or a FiberFusing geometry (Alteration) wrapping one.
 
     Returns:
         Polygon: A new Polygon instance representing the union of the input objects.
@@ -23,12 +27,54 @@ def get_polygon_union(*objects) -> Polygon:
     if len(objects) == 0:
         return Polygon(instance=geo.Polygon())
 
-    objects = [o._shapely_object if hasattr(o, '_shapely_object') else o for o in objects]
-    output = unary_union(objects)
+    shapely_objects = numpy.empty(len(objects), dtype=object)
+    shapely_objects[:] = [o._shapely_object if isinstance(o, Alteration) else o for o in objects]
+
+    # A single polygon is its own union, GEOS would only copy it
+    if len(shapely_objects) == 1 and isinstance(shapely_objects[0], geo.Polygon):
+        return Polygon(instance=shapely_objects[0])
+
+    output = shapely.union_all(shapely_objects)
 
     return Polygon(instance=output)
 
 
+def rasterize_polygons(polygons: List[Polygon], coordinate_system: CoordinateSystem, dtype: type = numpy.int8) -> numpy.ndarray:
+    """
+    Rasterizes several polygons on the same coordinate system.
+
+    Polygons relying on the generic polygon rasterization are rasterized together in a single scanline call,
+    the others (e.g. Circle, which caches its raster, or Square, which has an analytic rasterization) one by one.
+
+    Args:
+        polygons: The polygons to rasterize.
+        coordinate_system: The coordinate system used for rasterization.
+        dtype: The data type of the rasters. Default is int8.
+
+    Returns:
+        numpy.ndarray: A (P, ny, nx) array where the raster of the polygon p is ``output[p]``.
+    """
+    batched = [
+        idx for idx, polygon in enumerate(polygons)
+        if type(polygon).rasterize is Polygon.rasterize
+    ]
+
+    output = numpy.empty((len(polygons), *coordinate_system.shape), dtype=dtype)
+
+    for idx in set(range(len(polygons))).difference(batched):
+        output[idx] = polygons[idx].rasterize(coordinate_system=coordinate_system, dtype=dtype)
+
+    if batched:
+        output[batched] = rasterization.scanline_rasterize_many(
+            [polygons[idx]._shapely_object for idx in batched],
+            coordinate_system,
+            dtype=dtype,
+            edges_list=[polygons[idx]._get_edges() for idx in batched]
+        )
+
+    return output
+
+
 def interpret_to_point(*args: Union[Point, Iterable, geo.Point]) -> Union[Point, List[Point]]:
     """
     Converts various input formats to Point instances.
@@ -47,7 +93,11 @@ def interpret_to_point(*args: Union[Point, Iterable, geo.Point]) -> Union[Point,
         if isinstance(arg, Point):
             output.append(arg)
         elif isinstance(arg, Iterable):
-            output.append(Point(position=arg))
+            # Plain (x, y) pairs skip the dataclass validation, the shapely point is only built if needed
+            if isinstance(arg, (tuple, list, numpy.ndarray)) and len(arg) == 2:
+                output.append(Point._from_xy(float(arg[0]), float(arg[1])))
+            else:
+                output.append(Point(position=arg))
         elif isinstance(arg, geo.Point):
             output.append(Point(instance=arg))
 
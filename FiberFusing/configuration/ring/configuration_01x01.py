@@ -10,5 +10,3 @@ class FusedProfile_01x01(BaseFused):
 
     def initialize_structure(self):
         self.add_center_fiber(fiber_radius=self.fiber_radius)
-
-        self._clad_structure = self.fiber_list[0]
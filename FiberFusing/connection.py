@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import numpy
+import math
 import logging
 from scipy.optimize import minimize_scalar
 from pydantic.dataclasses import dataclass
@@ -98,7 +98,8 @@ class Connection:
         float
             The distance between the fiber centers.
         """
-        return self[0].center.distance(self[1].center)
+        (x0, y0), (x1, y1) = self[0]._get_center_xy(), self[1]._get_center_xy()
+        return math.hypot(x1 - x0, y1 - y0)
 
     @property
     def limit_added_area(self) -> ff.Polygon:
@@ -161,9 +162,9 @@ class Connection:
         point = line.mid_point.translate(perpendicular_vector * self.shift)
 
         if type.lower() in ['exterior', 'concave']:
-            radius = numpy.sqrt(self.shift**2 + (line.length / 2)**2) - self[0].radius
+            radius = math.hypot(self.shift, line.length / 2) - self[0].radius
         elif type.lower() in ['interior', 'convex']:
-            radius = numpy.sqrt(self.shift**2 + (line.length / 2)**2) + self[0].radius
+            radius = math.hypot(self.shift, line.length / 2) + self[0].radius
         else:
             raise ValueError(f"Invalid type '{type}'. Expected 'exterior' or 'interior'.")
 
@@ -204,7 +205,7 @@ class Connection:
         P2 = utils.nearest_points_exterior(self.virtual_circles[0], self[1])
         P3 = utils.nearest_points_exterior(self.virtual_circles[1], self[1])
 
-        return [ff.Point(position=(p.x, p.y)) for p in [P0, P1, P2, P3]]
+        return [ff.Point._from_xy(p.x, p.y) for p in [P0, P1, P2, P3]]
 
     def compute_mask(self) -> None:
         """
@@ -222,14 +223,13 @@ class Connection:
             self.mask = (mask - self.virtual_circles[0] - self.virtual_circles[1])
 
         elif self.topology.lower() == 'convex':
-            mid_point = ff.LineString(coordinates=[self[0].center, self[1].center]).mid_point
+            mid_point = ff.LineString.from_xy(*self[0]._get_center_xy(), *self[1]._get_center_xy()).mid_point
 
-            coordinates0 = [(p._shapely_object.x, p._shapely_object.y) for p in [mid_point, P0, P2]]
-            mask0 = ff.Polygon(coordinates=coordinates0)
-            mask0.scale(factor=1000, origin=mid_point._shapely_object, in_place=True)
+            coordinates0 = [(p.x, p.y) for p in [mid_point, P0, P2]]
+            coordinates1 = [(p.x, p.y) for p in [mid_point, P1, P3]]
+            mask0, mask1 = ff.Polygon.from_coordinates_batch([coordinates0, coordinates1])
 
-            coordinates1 = [(p._shapely_object.x, p._shapely_object.y) for p in [mid_point, P1, P3]]
-            mask1 = ff.Polygon(coordinates=coordinates1)
+            mask0.scale(factor=1000, origin=mid_point._shapely_object, in_place=True)
             mask1.scale(factor=1000, origin=mid_point._shapely_object, in_place=True)
 
             self.mask = (utils.union_geometries(mask0, mask1) & utils.union_geometries(*self.virtual_circles))
@@ -266,7 +266,7 @@ class Connection:
         ff.LineString
             The line connecting the centers of the two fibers.
         """
-        line = ff.LineString(coordinates=[self[0].center, self[1].center])
+        line = ff.LineString.from_xy(*self[0]._get_center_xy(), *self[1]._get_center_xy())
 
         if extended:
             line = line.make_length(line.length + self[0].radius + self[1].radius)
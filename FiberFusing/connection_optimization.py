@@ -1,7 +1,7 @@
 from typing import Tuple
 import logging
 from scipy.optimize import minimize_scalar
-from itertools import combinations
+import shapely
 from FiberFusing.connection import Connection
 from FiberFusing.buffer import Polygon
 from FiberFusing import utils
@@ -79,9 +79,18 @@ class ConnectionOptimization:
         tuple
             A pair of connected fibers.
         """
-        for fiber0, fiber1 in combinations(self.fiber_list, 2):
-            if not fiber0.intersection(fiber1).is_empty:
-                yield fiber0, fiber1
+        geometries = [fiber._shapely_object for fiber in self.fiber_list]
+
+        # The tree filters the candidate pairs by bounding box before the exact intersects test,
+        # instead of computing the intersection of every pair of fibers
+        tree = shapely.STRtree(geometries, node_capacity=10)
+        index_0, index_1 = tree.query(geometries, predicate='intersects')
+
+        # Each pair is reported in both directions, keep it once with the lower index first
+        pairs = sorted(zip(index_0[index_0 < index_1].tolist(), index_1[index_0 < index_1].tolist()))
+
+        for idx_0, idx_1 in pairs:
+            yield self.fiber_list[idx_0], self.fiber_list[idx_1]
 
     def shift_connections(self, virtual_shift: float) -> None:
         """
@@ -107,7 +116,7 @@ class ConnectionOptimization:
             The added section as a polygon.
         """
         added_section_list = [conn.added_section for conn in self.connected_fibers]
-        added_section = utils.union_geometries(*added_section_list) - utils.union_geometries(*self.fiber_list)
+        added_section = utils.union_geometries(added_section_list) - utils.union_geometries(self.fiber_list)
         added_section.remove_non_polygon_elements()
         return added_section
 
@@ -121,7 +130,7 @@ class ConnectionOptimization:
             The removed section as a polygon.
         """
         removed_section_list = [conn.removed_section for conn in self.connected_fibers]
-        return utils.union_geometries(*removed_section_list)
+        return utils.union_geometries(removed_section_list)
 
     def get_removed_area(self) -> float:
         """
@@ -133,7 +142,7 @@ class ConnectionOptimization:
             The total removed area.
         """
         disconnected_area = len(self.fiber_list) * self.fiber_list[0].area
-        connected_area = utils.union_geometries(*self.fiber_list).area
+        connected_area = utils.union_geometries(self.fiber_list).area
         return disconnected_area - connected_area
 
     def init_connected_fibers(self) -> None:
@@ -152,7 +161,7 @@ class ConnectionOptimization:
             The overall topology ('concave' or 'convex').
         """
         limit = [conn.limit_added_area for conn in self.connected_fibers]
-        overall_limit = utils.union_geometries(*limit) - utils.union_geometries(*self.fiber_list)
+        overall_limit = utils.union_geometries(limit) - utils.union_geometries(self.fiber_list)
         total_removed_area = self.get_removed_area()
         return 'convex' if total_removed_area > overall_limit.area else 'concave'
 
@@ -59,14 +59,25 @@ class CoordinateSystem:
         """
         Get an unstructured coordinate representation of the grid.
 
+        The array is cached until one of the grid parameters changes, so that rasterizing many
+        structures on the same grid does not rebuild it. It is therefore read-only.
+
         Returns
         -------
         numpy.ndarray
-            An unstructured array of coordinates.
+            An unstructured (read-only) array of coordinates.
         """
+        key = (self.nx, self.ny, self.min_x, self.max_x, self.min_y, self.max_y)
+        cache = getattr(self, '_unstructured_coordinate_cache', None)
+        if cache is not None and cache[0] == key:
+            return cache[1]
+
         coordinates = np.zeros([self.x_vector.size * self.y_vector.size, 2])
         coordinates[:, 0] = self.x_mesh.ravel()
         coordinates[:, 1] = self.y_mesh.ravel()
+        coordinates.setflags(write=False)
+
+        self._unstructured_coordinate_cache = (key, coordinates)
 
         return coordinates
 
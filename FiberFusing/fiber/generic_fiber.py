@@ -1,17 +1,19 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from typing import Tuple, Optional
+from typing import Tuple, Optional, TYPE_CHECKING
 import numpy
 from FiberFusing import Circle
 from FiberFusing.coordinate_system import CoordinateSystem
 from FiberFusing.fiber.structure_collection import BaseClass
 import pprint
-import matplotlib.pyplot as plt
 from FiberFusing.plottings import plot_polygon
 from FiberFusing.helper import _plot_helper
 from PyOptik import MaterialBank
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
 pp = pprint.PrettyPrinter(indent=4, sort_dicts=False, compact=True, width=1)
 
 
@@ -197,9 +199,7 @@ class GenericFiber(BaseClass):
         numpy.ndarray
             The shifted coordinates.
         """
-        shifted_coordinate = coordinate_system.to_unstructured_coordinate()
-        shifted_coordinate[:, 0] -= x_shift
-        shifted_coordinate[:, 1] -= y_shift
+        shifted_coordinate = coordinate_system.to_unstructured_coordinate() - (x_shift, y_shift)
 
         return shifted_coordinate
 
@@ -237,7 +237,7 @@ class GenericFiber(BaseClass):
         if shifted_coordinate.ndim != 2:
             raise ValueError("Shifted coordinates should have two dimensions.")
 
-        distance = numpy.sqrt(shifted_coordinate[:, 0]**2 + shifted_coordinate[:, 1]**2)
+        distance = numpy.hypot(shifted_coordinate[:, 0], shifted_coordinate[:, 1])
 
         if into_mesh:
             try:
@@ -356,7 +356,7 @@ class GenericFiber(BaseClass):
         )
 
     @_plot_helper
-    def plot(self, ax: plt.Axes = None, show_center: bool = False, show_core: bool = True) -> None:
+    def plot(self, ax: "plt.Axes" = None, show_center: bool = False, show_core: bool = True) -> None:
         """
         Plot the fiber geometry representation including patch and raster-mesh.
 
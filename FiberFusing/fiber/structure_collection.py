@@ -4,6 +4,7 @@
 import numpy
 from FiberFusing import Circle
 from FiberFusing import CircleOpticalStructure
+from FiberFusing.components.utils import rasterize_polygons
 import pprint
 from copy import deepcopy
 
@@ -151,8 +152,14 @@ class BaseClass:
         Returns:
             numpy.ndarray: The raster mesh of the structures.
         """
-        for structure in structure_list:
-            raster = structure.polygon.get_rasterized_mesh(coordinate_system=coordinate_system)
+        # All the layers are rasterized up front, the plain polygons in a single scanline call
+        rasters = rasterize_polygons(
+            [structure.polygon for structure in structure_list],
+            coordinate_system=coordinate_system,
+            dtype=numpy.float64
+        )
+
+        for structure, raster in zip(structure_list, rasters):
             mesh[numpy.where(raster != 0)] = 0
 
             if structure.is_graded:
@@ -1,6 +1,8 @@
+import math
 import numpy
 from dataclasses import dataclass
 from FiberFusing.buffer import Circle
+from FiberFusing.components.base_class import _rotate_matrix
 from FiberFusing import utils
 import FiberFusing as ff
 from FiberFusing.connection_optimization import ConnectionOptimization
@@ -47,7 +49,7 @@ class BaseClass:
         shapely.geometry.Polygon
             The union of all fibers without any fusion applied.
         """
-        return utils.union_geometries(*self.fiber_list)
+        return utils.union_geometries(self.fiber_list)
 
     def initialize_cores(self) -> None:
         """
@@ -70,7 +72,7 @@ class BaseClass:
         float
             The calculated scaling factor based on the fusion degree.
         """
-        factor = 1 - fusion_degree * (2 - numpy.sqrt(2))
+        factor = 1 - fusion_degree * (2 - math.sqrt(2))
         distance_between_cores = 2 * self.fiber_radius * factor
         scaling_factor = distance_between_cores / (2 * self.fiber_radius)
         return scaling_factor
@@ -99,6 +101,9 @@ class BaseClass:
         factor : float
             The scaling factor to adjust the positions.
         """
+        if factor == 1:
+            return
+
         for fiber in self.fiber_list:
             fiber.scale_position(factor=factor)
 
@@ -111,6 +116,9 @@ class BaseClass:
         shift : list of float
             A 2D shift vector [x, y] to translate the fiber cores.
         """
+        if shift[0] == 0 and shift[1] == 0:
+            return
+
         for fiber in self.fiber_list:
             fiber.shift_position(shift=shift)
 
@@ -158,14 +166,11 @@ class FiberLine(ConnectionOptimization, BaseClass):
 
         core_positions *= 2 * self.fiber_radius
 
-        rotation_angle = numpy.deg2rad(self.rotation_angle)
+        rotation_angle = math.radians(self.rotation_angle)
+        cos, sin = math.cos(rotation_angle), math.sin(rotation_angle)
 
         core_positions = [
-            (numpy.cos(rotation_angle) * pos, numpy.sin(rotation_angle) * pos) for pos in core_positions
-        ]
-
-        core_positions = [
-            ff.Point(position=position) for position in core_positions
+            ff.Point._from_xy(cos * pos, sin * pos) for pos in core_positions.tolist()
         ]
 
         return core_positions
@@ -197,14 +202,14 @@ class FiberRing(ConnectionOptimization, BaseClass):
         :type       distance_from_center:  float
         """
 
-        factor = numpy.sqrt(2 / (1 - numpy.cos(numpy.deg2rad(self.delta_angle))))
+        factor = math.sqrt(2 / (1 - math.cos(math.radians(self.delta_angle))))
 
         distance_from_center = factor * self.fiber_radius
 
-        first_core = ff.Point(position=[0, distance_from_center])
-
-        core_position = [
-            first_core.rotate(angle=angle, origin=[0, 0]) for angle in self.angle_list
-        ]
+        # The first core sits at (0, distance_from_center), rotating it only needs the second column of the matrix
+        core_position = []
+        for angle in self.angle_list.tolist():
+            _, b, _, e, _, _ = _rotate_matrix(angle)
+            core_position.append(ff.Point._from_xy(b * distance_from_center, e * distance_from_center))
 
         return core_position
@@ -1,18 +1,17 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from typing import List, Optional, Tuple, Union
+from typing import List, Optional, Tuple, Union, TYPE_CHECKING
 import numpy
 from scipy.ndimage import gaussian_filter
 import FiberFusing
-import matplotlib.pyplot as plt
 from FiberFusing.coordinate_system import CoordinateSystem
-from mpl_toolkits.axes_grid1 import make_axes_locatable
-import matplotlib.colors as colors
-from MPSPlots.styles import mps
 from FiberFusing.helper import _plot_helper
 from FiberFusing.background import BackGround
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
 
 class Geometry:
     """
@@ -353,7 +352,7 @@ class Geometry:
         return mesh
 
     @_plot_helper
-    def plot_patch(self, ax: plt.Axes = None, show: bool = True) -> None:
+    def plot_patch(self, ax: "plt.Axes" = None, show: bool = True) -> None:
         """
         Render the patch representation of the geometry onto a given matplotlib axis.
 
@@ -378,7 +377,7 @@ class Geometry:
         ax.ticklabel_format(axis='both', style='sci', scilimits=(-6, -6), useOffset=False)
 
     @_plot_helper
-    def plot_raster(self, ax: plt.Axes = None, gamma: float = 5) -> None:
+    def plot_raster(self, ax: "plt.Axes" = None, gamma: float = 5) -> None:
         """
         Render the rasterized representation of the geometry onto a given matplotlib axis.
 
@@ -395,6 +394,9 @@ class Geometry:
         -------
         None
         """
+        import matplotlib.colors as colors
+        from mpl_toolkits.axes_grid1 import make_axes_locatable
+
         image = ax.pcolormesh(
             self.coordinate_system.x_vector,
             self.coordinate_system.y_vector,
@@ -410,7 +412,7 @@ class Geometry:
         ax.set(title='Fiber structure', xlabel=r'x-distance [m]', ylabel=r'y-distance [m]')
         ax.ticklabel_format(axis='both', style='sci', scilimits=(-6, -6), useOffset=False)
 
-    def plot(self, show_patch: bool = True, show_mesh: bool = True, show: bool = True, gamma: float = 5) -> plt.Figure:
+    def plot(self, show_patch: bool = True, show_mesh: bool = True, show: bool = True, gamma: float = 5) -> "plt.Figure":
         """
         Plot the different representations (patch and mesh) of the geometry.
 
@@ -430,6 +432,9 @@ class Geometry:
         plt.Figure
             The matplotlib figure encompassing all the axes used in the plot.
         """
+        import matplotlib.pyplot as plt
+        from MPSPlots.styles import mps
+
         n_ax = bool(show_patch) + bool(show_mesh)
         unit_size = numpy.array([1, n_ax])
 
@@ -1,11 +1,17 @@
 import numpy
-from MPSPlots.styles import mps
-import matplotlib.pyplot as plt
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
 
 
 def _plot_helper(function):
-    def wrapper(self, ax: plt.Axes = None, show: bool = True, **kwargs):
+    def wrapper(self, ax: "plt.Axes" = None, show: bool = True, **kwargs):
+        import matplotlib.pyplot as plt
+
         if ax is None:
+            from MPSPlots.styles import mps
+
             with plt.style.context(mps):
                 _, ax = plt.subplots(1, 1)
                 ax.set_aspect('equal')
@@ -29,31 +35,25 @@ def _plot_helper(function):
 
 
 class OverlayStructureBaseClass:
-    def _overlay_structure_on_mesh_(self, structure_list: dict, mesh: numpy.ndarray, coordinate_system: object) -> numpy.ndarray:
+    def _overlay_single_structure_on_mesh_(self, polygon: object, index: float, mesh: numpy.ndarray, coordinate_system: object) -> numpy.ndarray:
         """
-        Return a mesh overlaying all the structures in the order they were defined.
+        Return a mesh overlaying a single uniform-index structure.
+
+        The polygon is rasterized once and its index is written to the mesh in a single masked store.
 
+        :param      polygon:            The polygon of the structure
+        :type       polygon:            Polygon
+        :param      index:              The refractive index of the structure
+        :type       index:              float
+        :param      mesh:               The mesh on which to overlay the structure
+        :type       mesh:               numpy.ndarray
         :param      coordinate_system:  The coordinates axis
         :type       coordinate_system:  Axis
 
-        :returns:   The raster mesh of the structures.
+        :returns:   The raster mesh of the structure.
         :rtype:     numpy.ndarray
         """
-        for structure in structure_list:
-            polygon = structure.polygon
-            raster = polygon.get_rasterized_mesh(coordinate_system=coordinate_system)
-            mesh[numpy.where(raster != 0)] = 0
-            index = structure.index
-
-            if hasattr(structure, 'graded_index_factor'):
-                index += self.get_graded_index_mesh(
-                    coordinate_system=coordinate_system,
-                    polygon=polygon,
-                    delta_n=structure.graded_index_factor
-                )
-
-            raster *= index
-
-            mesh += raster
+        mask = polygon.rasterize(coordinate_system=coordinate_system).reshape(coordinate_system.shape) != 0
+        mesh[mask] = index
 
         return mesh
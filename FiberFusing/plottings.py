@@ -1,10 +1,12 @@
-import numpy as np
-import matplotlib.pyplot as plt
+import shapely
 import shapely.geometry as geo
-from matplotlib.patches import Polygon as MplPolygon
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
 
-def plot_polygon(ax: plt.Axes, polygon: geo.base.BaseGeometry, facecolor: str = 'lightblue', alpha: float = 0.5, **kwargs):
+
+def plot_polygon(ax: "plt.Axes", polygon: geo.base.BaseGeometry, facecolor: str = 'lightblue', alpha: float = 0.5, **kwargs):
     """
     Plots a filled polygon or multipolygon, handling any holes on the given Matplotlib axis.
 
@@ -17,16 +19,18 @@ def plot_polygon(ax: plt.Axes, polygon: geo.base.BaseGeometry, facecolor: str =
     **kwargs
         Additional keyword arguments passed to the plot function (e.g., facecolor, edgecolor, alpha).
     """
+    from matplotlib.patches import Polygon as MplPolygon
+
     # Function to add a single polygon to the axis
     def add_polygon_to_ax(polygon_obj):
         # Plot the exterior as a filled polygon
-        exterior_coords = np.array(polygon_obj.exterior.coords)
+        exterior_coords = shapely.get_coordinates(polygon_obj.exterior)
         exterior_patch = MplPolygon(exterior_coords, facecolor=facecolor, edgecolor='black', alpha=alpha, **kwargs)
         ax.add_patch(exterior_patch)
 
         # Plot each hole (interior) as another polygon with the background color (transparent effect)
         for interior in polygon_obj.interiors:
-            hole_coords = np.array(interior.coords)
+            hole_coords = shapely.get_coordinates(interior)
             hole_patch = MplPolygon(hole_coords, facecolor='white', edgecolor='black', alpha=1)
             ax.add_patch(hole_patch)
 
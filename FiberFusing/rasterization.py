@@ -0,0 +1,326 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import numpy
+import shapely
+import shapely.geometry as geo
+
+try:
+    import numba
+except ImportError:  # numba is an optional dependency
+    numba = None
+
+# Setting FIBERFUSING_DISABLE_NUMBA skips the kernels (and their compilation) in favour of the NumPy and GEOS fallbacks
+if os.environ.get('FIBERFUSING_DISABLE_NUMBA', '').lower() not in ('', '0', 'false'):
+    numba = None
+
+# Above this number of edges the O(edges) crossing-number test per point loses to GEOS's prepared containment
+CONTAINS_POINTS_MAX_EDGES = 64
+
+
+def get_polygon_edges(polygon: geo.base.BaseGeometry) -> numpy.ndarray:
+    """
+    Collect the edges of every ring (exteriors and holes) of a Polygon or MultiPolygon.
+
+    Parameters
+    ----------
+    polygon : geo.base.BaseGeometry
+        The shapely Polygon or MultiPolygon to decompose.
+
+    Returns
+    -------
+    numpy.ndarray
+        A (M, 4) float64 array where each row is an edge (x0, y0, x1, y1).
+
+    Raises
+    ------
+    TypeError
+        If the geometry is neither a Polygon nor a MultiPolygon.
+    """
+    if not isinstance(polygon, (geo.Polygon, geo.MultiPolygon)):
+        raise TypeError("Input geometry must be a Polygon or MultiPolygon.")
+
+    # Stack the vertices of every ring in one array, ring_index tells which ring each vertex belongs to
+    rings = shapely.get_rings(shapely.get_parts(polygon))
+    vertices, ring_index = shapely.get_coordinates(rings, return_index=True)
+
+    # Consecutive vertices form an edge only when they belong to the same ring
+    same_ring = ring_index[:-1] == ring_index[1:]
+
+    return numpy.hstack([vertices[:-1][same_ring], vertices[1:][same_ring]])
+
+
+def _scanline_fill(edges: numpy.ndarray, offsets: numpy.ndarray, x_min: float, y_min: float, dx: float, dy: float, out: numpy.ndarray) -> None:
+    """
+    Fill ``out[p]`` with 1 for every grid node lying inside the polygon ``p`` described by ``edges``.
+
+    Each grid row is intersected with all the edges, the crossings are sorted and the nodes between
+    every pair of crossings are filled (even-odd rule), so holes are carved out in the same pass.
+    The rows of all the polygons are processed in a single parallel loop.
+
+    Parameters
+    ----------
+    edges : numpy.ndarray
+        A (M, 4) array of polygon edges (x0, y0, x1, y1), exteriors and holes alike, of all the polygons.
+    offsets : numpy.ndarray
+        A (P + 1,) array, the edges of polygon ``p`` are ``edges[offsets[p]:offsets[p + 1]]``.
+    x_min : float
+        The x-coordinate of the first grid column.
+    y_min : float
+        The y-coordinate of the first grid row.
+    dx : float
+        The grid spacing along x.
+    dy : float
+        The grid spacing along y.
+    out : numpy.ndarray
+        The (P, ny, nx) output array, filled in place.
+    """
+    n_polygons, ny, nx = out.shape
+
+    for row in numba.prange(n_polygons * ny):
+        p, j = row // ny, row % ny
+        y = y_min + j * dy
+        crossings = numpy.empty(offsets[p + 1] - offsets[p], dtype=numpy.float64)
+        n_crossings = 0
+
+        for k in range(offsets[p], offsets[p + 1]):
+            x0, y0, x1, y1 = edges[k, 0], edges[k, 1], edges[k, 2], edges[k, 3]
+            if (y0 <= y < y1) or (y1 <= y < y0):
+                crossings[n_crossings] = x0 + (y - y0) * (x1 - x0) / (y1 - y0)
+                n_crossings += 1
+
+        crossings = numpy.sort(crossings[:n_crossings])
+
+        for k in range(0, n_crossings - 1, 2):
+            i_start = max(int(numpy.ceil((crossings[k] - x_min) / dx)), 0)
+            i_stop = min(int(numpy.ceil((crossings[k + 1] - x_min) / dx)), nx)
+            for i in range(i_start, i_stop):
+                out[p, j, i] = 1
+
+
+if numba is not None:
+    # Compiled lazily on the first call (or by precompile) so that importing FiberFusing does not pay for it,
+    # cache=True then reuses it across processes
+    _scanline_fill = numba.njit(cache=True, parallel=True)(_scanline_fill)
+
+
+def _scanline_fill_vectorized(edges: numpy.ndarray, x_min: float, y_min: float, dx: float, dy: float, out: numpy.ndarray) -> None:
+    """
+    NumPy counterpart of :func:`_scanline_fill` for a single polygon, used when numba is not available.
+
+    Every (edge, row) crossing is computed at once with the same arithmetic as the kernel. Each crossing
+    toggles the inside state from the first node at or after it, so a cumulative sum along the rows gives
+    the even-odd fill without building the (nx * ny, 2) grid of coordinates.
+
+    Parameters
+    ----------
+    edges : numpy.ndarray
+        A (M, 4) array of polygon edges (x0, y0, x1, y1), exteriors and holes alike.
+    x_min : float
+        The x-coordinate of the first grid column.
+    y_min : float
+        The y-coordinate of the first grid row.
+    dx : float
+        The grid spacing along x.
+    dy : float
+        The grid spacing along y.
+    out : numpy.ndarray
+        The (ny, nx) output array, filled in place.
+    """
+    ny, nx = out.shape
+    x0, y0, x1, y1 = edges.T
+
+    # Candidate rows of every edge, with one row of margin, the exact half-open test below decides
+    row_start = numpy.clip(numpy.floor((numpy.minimum(y0, y1) - y_min) / dy), 0, ny).astype(numpy.int64)
+    row_stop = numpy.clip(numpy.ceil((numpy.maximum(y0, y1) - y_min) / dy) + 1, 0, ny).astype(numpy.int64)
+    counts = row_stop - row_start
+
+    edge_index = numpy.repeat(numpy.arange(edges.shape[0]), counts)
+    rows = row_start[edge_index] + numpy.arange(edge_index.size) - numpy.repeat(numpy.cumsum(counts) - counts, counts)
+
+    x0, y0, x1, y1 = x0[edge_index], y0[edge_index], x1[edge_index], y1[edge_index]
+    y = y_min + rows * dy
+
+    crossed = ((y0 <= y) & (y < y1)) | ((y1 <= y) & (y < y0))
+    rows, x0, y0, x1, y1, y = rows[crossed], x0[crossed], y0[crossed], x1[crossed], y1[crossed], y[crossed]
+
+    x = x0 + (y - y0) * (x1 - x0) / (y1 - y0)
+    columns = numpy.clip(numpy.ceil((x - x_min) / dx), 0, nx).astype(numpy.int64)
+
+    toggles = numpy.bincount(rows * (nx + 1) + columns, minlength=ny * (nx + 1)).reshape(ny, nx + 1)
+    out[...] = numpy.cumsum(toggles[:, :nx], axis=1) & 1
+
+
+def _even_odd_contains(edges: numpy.ndarray, points: numpy.ndarray, out: numpy.ndarray) -> None:
+    """
+    Flag in ``out`` every point lying inside the polygon described by ``edges``.
+
+    A horizontal ray is cast from each point and the edges it crosses are counted (crossing number),
+    an odd count meaning the point is inside. Holes are handled by the same parity rule.
+
+    Parameters
+    ----------
+    edges : numpy.ndarray
+        A (M, 4) array of polygon edges (x0, y0, x1, y1), exteriors and holes alike.
+    points : numpy.ndarray
+        A (N, 2) array of the (x, y) points to test.
+    out : numpy.ndarray
+        The (N,) boolean output array, filled in place.
+    """
+    n_edges = edges.shape[0]
+
+    for p in numba.prange(points.shape[0]):
+        px, py = points[p, 0], points[p, 1]
+        inside = False
+
+        for k in range(n_edges):
+            x0, y0, x1, y1 = edges[k, 0], edges[k, 1], edges[k, 2], edges[k, 3]
+            if ((y0 > py) != (y1 > py)) and (px < (x1 - x0) * (py - y0) / (y1 - y0) + x0):
+                inside = not inside
+
+        out[p] = inside
+
+
+if numba is not None:
+    _even_odd_contains = numba.njit(cache=True, parallel=True)(_even_odd_contains)
+
+
+def precompile() -> None:
+    """
+    Compile the numba kernels now rather than on their first use.
+
+    The kernels are compiled lazily so that importing FiberFusing stays cheap. Without a warm on-disk
+    cache, the first raster therefore pays the compilation (a few seconds). Calling this function once,
+    e.g. at the start of a script or of a worker process, moves that cost out of the first raster.
+    It does nothing when numba is not available or is disabled through FIBERFUSING_DISABLE_NUMBA.
+    """
+    if numba is None:
+        return
+
+    edges = get_polygon_edges(geo.box(0, 0, 1, 1))
+    offsets = numpy.array([0, edges.shape[0]], dtype=numpy.int64)
+
+    # Same argument types as the calls made by the rasterization, so every specialization they need is compiled
+    for dtype in (numpy.int8, numpy.float64):
+        _scanline_fill(edges, offsets, 0.0, 0.0, 0.5, 0.5, numpy.zeros((1, 3, 3), dtype=dtype))
+
+    points = numpy.zeros((1, 2), dtype=numpy.float64)
+    readonly_points = points.copy()
+    readonly_points.setflags(write=False)  # e.g. the cached grid of a CoordinateSystem
+
+    for array in (points, readonly_points):
+        _even_odd_contains(edges, array, numpy.zeros(1, dtype=numpy.bool_))
+
+
+def contains_points(edges: numpy.ndarray, points: numpy.ndarray) -> numpy.ndarray:
+    """
+    Test which points lie inside the polygon described by its edges.
+
+    Parameters
+    ----------
+    edges : numpy.ndarray
+        A (M, 4) array of polygon edges as returned by :func:`get_polygon_edges`.
+    points : numpy.ndarray
+        A (N, 2) array of the (x, y) points to test.
+
+    Returns
+    -------
+    numpy.ndarray
+        A (N,) boolean array, True where the point is inside the polygon (and outside its holes).
+
+    Raises
+    ------
+    ImportError
+        If numba is not installed.
+    """
+    if numba is None:
+        raise ImportError("numba is required for the crossing-number point containment.")
+
+    out = numpy.zeros(points.shape[0], dtype=numpy.bool_)
+
+    if edges.shape[0] == 0:
+        return out
+
+    _even_odd_contains(edges, numpy.ascontiguousarray(points, dtype=numpy.float64), out)
+
+    return out
+
+
+def scanline_rasterize(polygon: geo.base.BaseGeometry, coordinate_system, dtype: type = numpy.int8, edges: numpy.ndarray = None) -> numpy.ndarray:
+    """
+    Rasterize a shapely Polygon or MultiPolygon on the structured grid of a coordinate system.
+
+    Parameters
+    ----------
+    polygon : geo.base.BaseGeometry
+        The shapely Polygon or MultiPolygon to rasterize.
+    coordinate_system : CoordinateSystem
+        The coordinate system defining the grid.
+    dtype : type, optional
+        The data type of the raster (int8 or float64), filled directly by the kernel. Default is int8.
+    edges : numpy.ndarray, optional
+        The edges of the polygon as returned by :func:`get_polygon_edges`, computed from the polygon if not given.
+
+    Returns
+    -------
+    numpy.ndarray
+        A (ny, nx) array where 1 indicates the presence of the polygon and 0 its absence.
+    """
+    edges_list = None if edges is None else [edges]
+
+    return scanline_rasterize_many([polygon], coordinate_system, dtype=dtype, edges_list=edges_list)[0]
+
+
+def scanline_rasterize_many(polygons: list, coordinate_system, dtype: type = numpy.int8, edges_list: list = None) -> numpy.ndarray:
+    """
+    Rasterize several shapely Polygons or MultiPolygons on the structured grid of a coordinate system
+    with a single kernel call (or a NumPy scanline per polygon when numba is not available).
+
+    Parameters
+    ----------
+    polygons : list of geo.base.BaseGeometry
+        The shapely Polygons or MultiPolygons to rasterize.
+    coordinate_system : CoordinateSystem
+        The coordinate system defining the grid.
+    dtype : type, optional
+        The data type of the rasters (int8 or float64), filled directly by the kernel. Default is int8.
+    edges_list : list of numpy.ndarray, optional
+        The edges of each polygon as returned by :func:`get_polygon_edges`, computed from the polygons if not given.
+
+    Returns
+    -------
+    numpy.ndarray
+        A (P, ny, nx) array where ``out[p]`` is 1 inside the polygon ``p`` and 0 outside.
+    """
+    out = numpy.zeros((len(polygons), *coordinate_system.shape), dtype=dtype)
+
+    if edges_list is None:
+        edges_list = [get_polygon_edges(polygon) for polygon in polygons]
+
+    # A single column (row) has no spacing, but then only the node at min_x (min_y) is tested and any positive step gives the same raster
+    dx = float(coordinate_system.dx) if coordinate_system.nx > 1 else 1.0
+    dy = float(coordinate_system.dy) if coordinate_system.ny > 1 else 1.0
+    grid = float(coordinate_system.min_x), float(coordinate_system.min_y), dx, dy
+
+    # Without numba the polygons are filled one by one with the NumPy scanline, which gives the same rasters
+    if numba is None:
+        for edges, raster in zip(edges_list, out):
+            if edges.shape[0] != 0:
+                _scanline_fill_vectorized(edges, *grid, raster)
+        return out
+
+    offsets = numpy.zeros(len(edges_list) + 1, dtype=numpy.int64)
+    numpy.cumsum([edges.shape[0] for edges in edges_list], out=offsets[1:])
+
+    if offsets[-1] == 0:
+        return out
+
+    _scanline_fill(
+        numpy.concatenate(edges_list),
+        offsets,
+        *grid,
+        out
+    )
+
+    return out
@@ -1,7 +1,10 @@
 from collections.abc import Iterable
 from itertools import combinations
+import numpy
 import FiberFusing as ff
-from shapely.ops import unary_union, nearest_points
+from FiberFusing.components.base_class import Alteration
+import shapely
+from shapely.ops import nearest_points
 import shapely.geometry as geo
 
 
@@ -12,20 +15,20 @@ def nearest_points_exterior(object0, object1) -> ff.Point:
     Parameters
     ----------
     object0 : shapely.geometry or object
-        The first geometric object or an object with a '_shapely_object' attribute.
+        The first geometric object or a FiberFusing geometry wrapping one.
     object1 : shapely.geometry or object
-        The second geometric object or an object with a '_shapely_object' attribute.
+        The second geometric object or a FiberFusing geometry wrapping one.
 
     Returns
     -------
     ff.Point
         A Point containing the coordinates of the nearest point on the first object to the second.
     """
-    object0 = object0._shapely_object if hasattr(object0, '_shapely_object') else object0
-    object1 = object1._shapely_object if hasattr(object1, '_shapely_object') else object1
+    object0 = object0._shapely_object if isinstance(object0, Alteration) else object0
+    object1 = object1._shapely_object if isinstance(object1, Alteration) else object1
 
     nearest_point = nearest_points(object0.exterior, object1.exterior)[0]
-    return ff.Point(position=(nearest_point.x, nearest_point.y))
+    return ff.Point._from_xy(nearest_point.x, nearest_point.y)
 
 
 def union_geometries(*objects) -> ff.Polygon:
@@ -35,21 +38,71 @@ def union_geometries(*objects) -> ff.Polygon:
     Parameters
     ----------
     objects : shapely.geometry or object
-        A variable number of shapely geometric objects or objects with a '_shapely_object' attribute.
+        A variable number of shapely geometric objects or FiberFusing geometries wrapping one.
+        A single list, tuple or numpy array of such objects is also accepted, which avoids unpacking
+        long structure lists into positional arguments.
 
     Returns
     -------
     ff.Polygon
         A Polygon containing the union of all provided objects.
     """
-    if not objects:
+    if len(objects) == 1 and isinstance(objects[0], (list, tuple, numpy.ndarray)):
+        objects = objects[0]
+
+    if len(objects) == 0:
         return ff.Polygon(instance=geo.Polygon())
 
-    shapely_objects = [o._shapely_object if hasattr(o, '_shapely_object') else o for o in objects]
-    union_result = unary_union(shapely_objects)
+    shapely_objects = numpy.empty(len(objects), dtype=object)
+    shapely_objects[:] = [o._shapely_object if isinstance(o, Alteration) else o for o in objects]
+
+    # A single polygon is its own union, GEOS would only copy it
+    if len(shapely_objects) == 1 and isinstance(shapely_objects[0], geo.Polygon):
+        return ff.Polygon(instance=shapely_objects[0])
+
+    union_result = shapely.union_all(shapely_objects)
     return ff.Polygon(instance=union_result)
 
 
+def cascaded_union_geometries(objects, chunk_size: int = 8) -> ff.Polygon:
+    """
+    Compute the union of many geometric objects by reducing them in a tree of small chunks.
+
+    The objects are grouped into chunks of ``chunk_size`` elements, each chunk is merged with a
+    single ``shapely.union_all`` call and the partial results are merged again until one geometry remains.
+    This keeps every intermediate union small when assembling structures made of many fibers.
+
+    Parameters
+    ----------
+    objects : iterable
+        Shapely geometric objects or FiberFusing geometries wrapping one.
+    chunk_size : int, optional
+        Number of geometries merged per union call. Default is 8.
+
+    Returns
+    -------
+    ff.Polygon
+        A Polygon containing the union of all provided objects.
+    """
+    if chunk_size < 2:
+        raise ValueError("chunk_size must be at least 2.")
+
+    shapely_objects = [o._shapely_object if isinstance(o, Alteration) else o for o in objects]
+
+    if not shapely_objects:
+        return ff.Polygon(instance=geo.Polygon())
+
+    while True:
+        shapely_objects = [
+            shapely.union_all(shapely_objects[idx: idx + chunk_size])
+            for idx in range(0, len(shapely_objects), chunk_size)
+        ]
+        if len(shapely_objects) == 1:
+            break
+
+    return ff.Polygon(instance=shapely_objects[0])
+
+
 def intersection_geometries(*objects) -> ff.Polygon:
     """
     Compute the intersection of multiple geometric objects.
@@ -57,7 +110,7 @@ def intersection_geometries(*objects) -> ff.Polygon:
     Parameters
     ----------
     objects : shapely.geometry or object
-        A variable number of shapely geometric objects or objects with a '_shapely_object' attribute.
+        A variable number of shapely geometric objects or FiberFusing geometries wrapping one.
 
     Returns
     -------
@@ -67,8 +120,8 @@ def intersection_geometries(*objects) -> ff.Polygon:
     if not objects:
         return ff.Polygon()
 
-    shapely_objects = [o._shapely_object if hasattr(o, '_shapely_object') else o for o in objects]
-    intersection_result = unary_union([a.intersection(b) for a, b in combinations(shapely_objects, 2)])
+    shapely_objects = [o._shapely_object if isinstance(o, Alteration) else o for o in objects]
+    intersection_result = shapely.union_all([a.intersection(b) for a, b in combinations(shapely_objects, 2)])
     return ff.Polygon(instance=intersection_result)
 
 
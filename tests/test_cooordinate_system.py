@@ -52,6 +52,20 @@ def test_to_unstructured_coordinate():
     assert np.allclose(coords, expected_coords)
 
 
+def test_unstructured_coordinate_cache_follows_grid_updates():
+    system = CoordinateSystem(nx=3, ny=3, min_x=-1.0, max_x=1.0, min_y=-1.0, max_y=1.0)
+    coords = system.to_unstructured_coordinate()
+
+    assert system.to_unstructured_coordinate() is coords
+    assert not coords.flags.writeable
+
+    system.update(nx=5)
+    coords = system.to_unstructured_coordinate()
+
+    assert coords.shape == (15, 2)
+    assert np.allclose(coords[:5, 0], [-1.0, -0.5, 0.0, 0.5, 1.0])
+
+
 def test_ensure_odd():
     system = CoordinateSystem(nx=10, ny=10, min_x=-5.0, max_x=5.0, min_y=-5.0, max_y=5.0)
     system.ensure_odd('nx')
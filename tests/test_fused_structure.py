@@ -3,6 +3,7 @@
 
 from unittest.mock import patch
 import pytest
+import numpy
 from FiberFusing import configuration
 import matplotlib.pyplot as plt
 
@@ -48,10 +49,116 @@ def test_configuration_api():
     structure.translate(shift=(-5e6, +20e-6))
 
 
+def test_core_positions_follow_transformations():
+    structure = configuration.line.FusedProfile_02x02(fusion_degree=0.3, fiber_radius=62.5e-6, index=1)
+    initial_positions = numpy.asarray([(core.x, core.y) for core in structure.get_core_positions()])
+
+    structure.rotate(90)
+    structure.translate(shift=(10e-6, 0))
+
+    expected_positions = initial_positions @ numpy.array([[0, 1], [-1, 0]]) + [10e-6, 0]
+    assert numpy.allclose([(core.x, core.y) for core in structure.get_core_positions()], expected_positions, atol=1e-12)
+    assert numpy.allclose([(core.x, core.y) for core in structure.cores], expected_positions, atol=1e-12)
+
+
+def test_randomize_core_position():
+    structure = configuration.line.FusedProfile_03x03(fusion_degree=0.3, fiber_radius=62.5e-6, index=1)
+    centers = numpy.asarray([(fiber.core.x, fiber.core.y) for fiber in structure.fiber_list])
+
+    structure.randomize_core_position(random_factor=4e-6)
+
+    shifts = numpy.asarray([(core.x, core.y) for core in structure.cores]) - centers
+    assert numpy.all((shifts >= 0) & (shifts < 4e-6))
+
+    # The nominal positions are not affected by the randomization
+    assert numpy.allclose([(core.x, core.y) for core in structure.get_core_positions()], centers)
+
+
+def test_randomize_core_position_with_seed():
+    cores = []
+    for _ in range(2):
+        structure = configuration.line.FusedProfile_03x03(fusion_degree=0.3, fiber_radius=62.5e-6, index=1)
+        structure.randomize_core_position(random_factor=4e-6, seed=0)
+        cores.append([(core.x, core.y) for core in structure.cores])
+
+    assert numpy.array_equal(cores[0], cores[1])
+
+
+def test_clad_structure_is_cached():
+    structure = configuration.line.FusedProfile_02x02(fusion_degree=0.3, fiber_radius=62.5e-6, index=1)
+    clad = structure.clad_structure
+    assert structure.clad_structure is clad
+
+    # Rotations and translations move the cached polygon rather than rebuilding it
+    structure.rotate(90)
+    structure.translate(shift=(10e-6, 0))
+    assert structure.clad_structure is clad
+
+    structure.add_single_fiber(fiber_radius=62.5e-6, position=(0, 500e-6))
+    assert structure.clad_structure is not clad
+    assert structure.clad_structure.area > clad.area
+
+
+@pytest.mark.parametrize('transformation', ['rotate', 'translate'])
+def test_transformation_is_kept_after_adding_a_fiber(transformation):
+    structure = configuration.line.FusedProfile_02x02(fusion_degree=0.3, fiber_radius=62.5e-6, index=1)
+    reference = configuration.line.FusedProfile_02x02(fusion_degree=0.3, fiber_radius=62.5e-6, index=1)
+
+    for profile in (structure, reference):
+        if transformation == 'rotate':
+            profile.rotate(90)
+        else:
+            profile.translate(shift=(100e-6, 0))
+
+    structure.add_single_fiber(fiber_radius=5e-6, position=(300e-6, 300e-6))
+
+    assert numpy.allclose(structure.clad_structure.bounds[:2], reference.clad_structure.bounds[:2], atol=1e-12)
+    assert numpy.isclose(structure.clad_structure.area, reference.clad_structure.area + numpy.pi * 25e-12, rtol=1e-3)
+
+
 def test_fail_configuration_initialization():
     with pytest.raises(AssertionError):
         configuration.ring.FusedProfile_02x02(fusion_degree=1.2, fiber_radius=1, index=1)
 
 
+def test_add_structures_matches_sequential_add():
+    specs = [
+        dict(structure_type='line', number_of_fibers=2, fiber_radius=62.5e-6, fusion_degree=0.3, compute_fusing=True),
+        dict(structure_type='ring', number_of_fibers=6, fiber_radius=62.5e-6, position_shift=[0, 300e-6]),
+    ]
+
+    sequential = configuration.ring.FusedProfile_01x01(fiber_radius=62.5e-6, index=1)
+    for spec in specs:
+        sequential.add_structure(**spec)
+
+    batched = configuration.ring.FusedProfile_01x01(fiber_radius=62.5e-6, index=1)
+    batched.add_structures(specs)
+
+    assert numpy.allclose(
+        [(core.x, core.y) for core in batched.get_core_positions()],
+        [(core.x, core.y) for core in sequential.get_core_positions()]
+    )
+    assert numpy.isclose(batched.clad_structure.area, sequential.clad_structure.area)
+    assert numpy.isclose(batched.added_section.area, sequential.added_section.area)
+
+
+def test_is_multi_and_refractive_index_list():
+    structure = configuration.ring.FusedProfile_03x03(fiber_radius=62.5e-6, index=1.4, fusion_degree=0.3)
+
+    assert not structure.is_multi
+    assert structure.refractive_index_list == [1.4]
+
+    structure.add_single_fiber(fiber_radius=62.5e-6, position=(1e-3, 1e-3))
+
+    assert structure.is_multi
+
+
+def test_fail_invalid_structure_type():
+    structure = configuration.ring.FusedProfile_01x01(fiber_radius=62.5e-6, index=1)
+
+    with pytest.raises(ValueError):
+        structure.add_structure(structure_type='square', number_of_fibers=4, fiber_radius=62.5e-6)
+
+
 if __name__ == "__main__":
     pytest.main(["-W error", __file__])
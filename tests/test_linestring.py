@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+from FiberFusing.components.linestring import LineString
+from FiberFusing.components.point import Point
+
+
+def test_linestring_perpendicular():
+    line = LineString(coordinates=[Point(position=(0, 0)), Point(position=(2, 0))])
+    perpendicular = line.get_perpendicular()
+
+    assert isinstance(perpendicular, LineString)
+    assert np.allclose(perpendicular.endpoints, [[1, 2], [1, -2]])
+    assert np.isclose(perpendicular.length, line.length * 2)
+    assert perpendicular.copy()._shapely_object.equals(perpendicular._shapely_object)
+
+
+def test_linestring_from_xy():
+    line = LineString.from_xy(0, 0, 3, 4)
+    reference = LineString(coordinates=[Point(position=(0, 0)), Point(position=(3, 4))])
+
+    assert line._shapely_object.equals(reference._shapely_object)
+    assert np.isclose(line.length, 5.0)
+    assert np.allclose((line.mid_point.x, line.mid_point.y), (1.5, 2.0))
+
+
+def test_linestring_float_helpers():
+    line = LineString.from_xy(0, 0, 4, 2)
+
+    assert line.get_position_parametrization(0.25).position == (1.0, 0.5)
+    assert np.allclose(line.get_vector(), np.array([4, 2]) / np.hypot(4, 2))
+    assert np.allclose(line.centering(Point(position=(0, 0))).endpoints, [[-2, -1], [2, 1]])
+    assert np.allclose(line.endpoints, [[0, 0], [4, 2]])
+
+
+if __name__ == "__main__":
+    pytest.main(["-W error", __file__])
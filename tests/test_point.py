@@ -0,0 +1,21 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+from FiberFusing.components.point import Point
+
+
+def test_point_arithmetic_with_tuples():
+    point = Point(position=(1, 2))
+
+    assert (point + (1, 1)).position == (2.0, 3.0)
+    assert (point - [1, 1]).position == (0.0, 1.0)
+    assert (point + np.array([0.5, 0.5])).position == (1.5, 2.5)
+    assert (point + Point(position=(1, 1))).position == (2.0, 3.0)
+    assert point.shift_position((-1, -2)).position == (0.0, 0.0)
+    assert point.position == (1, 2)
+
+
+if __name__ == "__main__":
+    pytest.main(["-W error", __file__])
@@ -1,8 +1,18 @@
+import copy
+import importlib
 import pytest
 import numpy as np
+import shapely
 import shapely.geometry as geo
+from shapely import affinity
+from FiberFusing import rasterization
 from FiberFusing.coordinate_system import CoordinateSystem
 from FiberFusing.components.polygon import Polygon
+from FiberFusing.buffer import Circle, Ellipse, Square
+from FiberFusing.components.point import Point
+from FiberFusing.components.linestring import LineString
+from FiberFusing.components.base_class import transform_geometries, _rotate_matrix
+from FiberFusing.components.utils import rasterize_polygons
 from unittest.mock import patch
 
 @pytest.fixture
@@ -21,6 +31,26 @@ def sample_multipolygon():
     return Polygon(instance=multipolygon)
 
 
+@pytest.fixture
+def polygon_with_hole():
+    # Returns a square with a square hole in its middle
+    coordinates = [(0, 0), (2, 0), (2, 2), (0, 2)]
+    hole_coordinates = [(0.5, 0.5), (1.5, 0.5), (1.5, 1.5), (0.5, 1.5)]
+    return geo.Polygon(coordinates, [hole_coordinates])
+
+
+@pytest.fixture
+def polygon_with_hole_and_island(polygon_with_hole):
+    # Returns a MultiPolygon made of the holed square and a separate square
+    return Polygon(instance=polygon_with_hole.union(geo.box(2.5, 2.5, 3.5, 3.5)))
+
+
+@pytest.fixture
+def coordinate_system():
+    # Returns a grid whose nodes do not fall on the edges of the polygons above
+    return CoordinateSystem(nx=41, ny=37, min_x=-0.33, max_x=4.07, min_y=-0.21, max_y=4.13)
+
+
 def test_initialization_with_coordinates():
     coordinates = [(0, 0), (1, 0), (1, 1), (0, 1)]
     polygon = Polygon(coordinates=coordinates)
@@ -34,6 +64,27 @@ def test_initialization_with_instance():
     assert polygon._shapely_object.equals(polygon_instance)
 
 
+def test_from_arrays():
+    xy = np.array([(0, 0), (1, 0), (1, 1), (0, 1)], dtype=float)
+    polygon = Polygon.from_arrays(xy, index=1.4)
+
+    assert polygon._shapely_object.equals(geo.Polygon(xy))
+    assert polygon.index == 1.4
+
+
+def test_from_coordinates_batch():
+    triangle = [(0, 0), (1, 0), (1, 1)]
+    square = [(2, 2), (3, 2), (3, 3), (2, 3)]
+
+    polygons = Polygon.from_coordinates_batch([triangle, square], index=1.4)
+
+    assert len(polygons) == 2
+    assert polygons[0]._shapely_object.equals(geo.Polygon(triangle))
+    assert polygons[1]._shapely_object.equals(geo.Polygon(square))
+    assert all(polygon.index == 1.4 for polygon in polygons)
+    assert Polygon.from_coordinates_batch([]) == []
+
+
 def test_initialization_error():
     with pytest.raises(ValueError):
         Polygon()
@@ -44,6 +95,20 @@ def test_get_hole_no_holes(sample_polygon):
     assert hole.is_empty, 'Hole should be marked as empty'
 
 
+def test_get_hole():
+    holes = [[(0.2, 0.2), (0.8, 0.2), (0.8, 0.8), (0.2, 0.8)], [(1.2, 1.2), (1.8, 1.2), (1.8, 1.8), (1.2, 1.8)]]
+    polygon = Polygon(instance=geo.Polygon([(0, 0), (2, 0), (2, 2), (0, 2)], holes))
+
+    hole = polygon.get_hole()
+
+    assert hole._shapely_object.equals(geo.MultiPolygon([geo.Polygon(h) for h in holes]))
+
+    single_hole = Polygon(instance=geo.Polygon([(0, 0), (2, 0), (2, 2), (0, 2)], holes[:1])).get_hole()
+
+    assert isinstance(single_hole._shapely_object, geo.Polygon)
+    assert single_hole._shapely_object.equals(geo.Polygon(holes[0]))
+
+
 def test_remove_non_polygon_elements():
     collection = geo.GeometryCollection([
         geo.Point(0, 0),
@@ -70,6 +135,80 @@ def test_plot(sample_polygon):
     # Check if the plot contains polygon elements; visual validation may be necessary.
 
 
+def test_copy_is_independent():
+    circle = Circle(position=(0, 0), radius=1.0)
+    duplicate = circle.copy()
+    duplicate.translate(shift=(1, 1), in_place=True)
+    duplicate.core.translate(shift=(1, 1), in_place=True)
+
+    assert np.allclose(circle.bounds, (-1, -1, 1, 1))
+    assert np.allclose((circle.core.x, circle.core.y), (0, 0))
+    assert np.allclose((duplicate.core.x, duplicate.core.y), (1, 1))
+
+
+def test_copy_recurses_into_containers():
+    circle = Circle(position=(0, 0), radius=1.0)
+    circle.markers = [Point(position=(0, 0))]
+    circle.named_markers = {'center': Point(position=(0, 0))}
+
+    duplicate = circle.copy()
+    duplicate.markers[0].translate(shift=(1, 1), in_place=True)
+    duplicate.named_markers['center'].translate(shift=(1, 1), in_place=True)
+
+    assert np.allclose((circle.markers[0].x, circle.markers[0].y), (0, 0))
+    assert np.allclose((circle.named_markers['center'].x, circle.named_markers['center'].y), (0, 0))
+    assert np.allclose((duplicate.markers[0].x, duplicate.markers[0].y), (1, 1))
+
+    line = LineString(coordinates=[Point(position=(0, 0)), Point(position=(1, 0))])
+    line_duplicate = line.copy()
+    line_duplicate.coordinates[0].translate(shift=(5, 5), in_place=True)
+
+    assert isinstance(line_duplicate.coordinates, tuple)
+    assert np.allclose((line.coordinates[0].x, line.coordinates[0].y), (0, 0))
+
+
+def test_split_with_line_leaves_line_unchanged(sample_polygon):
+    line = LineString(coordinates=[Point(position=(0.5, 0.25)), Point(position=(0.5, 0.75))])
+    original = line._shapely_object
+
+    largest = sample_polygon.split_with_line(line=line, return_largest=True)
+    smallest = sample_polygon.split_with_line(line=line, return_largest=False)
+
+    assert line._shapely_object is original
+    assert line._shapely_object.equals(geo.LineString([(0.5, 0.25), (0.5, 0.75)]))
+    assert np.isclose(largest.area + smallest.area, 1.0)
+
+
+def test_property_cache_follows_shapely_object(sample_polygon):
+    assert sample_polygon.bounds == (0, 0, 1, 1)
+    assert np.isclose(sample_polygon.area, 1.0)
+
+    center = sample_polygon.center
+    center.translate(shift=(5, 5), in_place=True)
+    assert np.allclose((sample_polygon.center.x, sample_polygon.center.y), (0.5, 0.5))
+
+    sample_polygon.translate(shift=(1, 2), in_place=True)
+    assert np.allclose(sample_polygon.bounds, (1, 2, 2, 3))
+    assert np.allclose((sample_polygon.center.x, sample_polygon.center.y), (1.5, 2.5))
+
+    sample_polygon.scale(factor=2, in_place=True)
+    assert np.isclose(sample_polygon.area, 4.0)
+
+
+def test_deepcopy_shares_geometry():
+    circle = Circle(position=(0, 0), radius=1.0)
+    duplicate = copy.deepcopy(circle)
+
+    assert duplicate._shapely_object is circle._shapely_object
+    assert duplicate._shapely_object.equals_exact(circle._shapely_object, 0)
+
+    duplicate.translate(shift=(1, 1), in_place=True)
+    duplicate.core.translate(shift=(1, 1), in_place=True)
+
+    assert np.allclose(circle.bounds, (-1, -1, 1, 1))
+    assert np.allclose((circle.core.x, circle.core.y), (0, 0))
+
+
 def test_contains_points(sample_polygon):
     points = np.array([[0.5, 0.5], [1.5, 1.5]])
     result = sample_polygon.contains_points(points)
@@ -85,10 +224,7 @@ def test_rasterize(sample_polygon):
     assert result.shape == (10, 10)
 
 
-def test_polygon_hole_contains_points():
-    coordinates = [(0, 0), (2, 0), (2, 2), (0, 2)]
-    hole_coordinates = [(0.5, 0.5), (1.5, 0.5), (1.5, 1.5), (0.5, 1.5)]
-    polygon_with_hole = geo.Polygon(coordinates, [hole_coordinates])
+def test_polygon_hole_contains_points(polygon_with_hole):
     polygon = Polygon(instance=polygon_with_hole)
 
     points = np.array([[0.3, 0.3], [1.0, 1.0], [0.1, 0.1]])
@@ -96,5 +232,194 @@ def test_polygon_hole_contains_points():
     assert np.array_equal(result, np.array([True, False, True]))
 
 
+def test_scanline_rasterize_matches_point_containment(polygon_with_hole_and_island, coordinate_system):
+    polygon = polygon_with_hole_and_island
+
+    raster = rasterization.scanline_rasterize(polygon._shapely_object, coordinate_system)
+    expected = polygon.contains_points(coordinate_system.to_unstructured_coordinate()).reshape(coordinate_system.shape)
+
+    assert np.array_equal(raster.astype(bool), expected)
+
+
+def test_crossing_number_matches_shapely_containment(polygon_with_hole):
+    if rasterization.numba is None:
+        pytest.skip('numba is not installed or is disabled through FIBERFUSING_DISABLE_NUMBA')
+
+    polygon = Polygon(instance=polygon_with_hole.union(geo.Point(3, 3).buffer(0.5)))
+    points = np.random.default_rng(0).uniform(-0.5, 4, size=(2000, 2))
+
+    expected = shapely.contains_xy(polygon._shapely_object, points[:, 0], points[:, 1])
+
+    assert np.array_equal(polygon.contains_points(points), expected)
+    assert np.array_equal(rasterization.contains_points(polygon._get_edges(), points), expected)
+
+
+def test_rasterize_fallback_without_numba(monkeypatch, polygon_with_hole_and_island, coordinate_system):
+    monkeypatch.setattr(rasterization, 'numba', None)
+    polygon = polygon_with_hole_and_island
+
+    raster = polygon.rasterize(coordinate_system)
+    expected = polygon.contains_points(coordinate_system.to_unstructured_coordinate()).reshape(coordinate_system.shape)
+
+    assert np.array_equal(raster.astype(bool), expected)
+
+
+def test_vectorized_scanline_matches_kernel(monkeypatch):
+    if rasterization.numba is None:
+        pytest.skip('numba is not installed or is disabled through FIBERFUSING_DISABLE_NUMBA')
+
+    coordinate_system = CoordinateSystem(nx=53, ny=47, min_x=-1.0, max_x=1.0, min_y=-1.0, max_y=1.0)
+
+    polygon_with_hole = geo.Polygon([(-1, -1), (0.2, -1), (0.2, 0.2), (-1, 0.2)], [[(-0.5, -0.5), (0, -0.5), (0, 0), (-0.5, 0)]])
+    polygons = [
+        Polygon(instance=geo.Point(0.8, -0.2).buffer(0.5)),
+        Polygon(instance=geo.box(-0.5, -0.5, 0.5, 0.5)),
+        Polygon(instance=polygon_with_hole.union(geo.box(0.5, 0.5, 1.5, 0.9))),
+        Polygon(instance=geo.Polygon()),
+    ]
+
+    expected = rasterize_polygons(polygons, coordinate_system)
+
+    monkeypatch.setattr(rasterization, 'numba', None)
+    rasters = rasterize_polygons(polygons, coordinate_system)
+
+    assert np.array_equal(rasters, expected)
+
+
+@pytest.mark.parametrize('nx, ny', [(1, 5), (7, 1), (1, 1)])
+def test_rasterize_single_row_or_column_grid(nx, ny):
+    coordinate_system = CoordinateSystem(nx=nx, ny=ny, min_x=0.0, max_x=1.0, min_y=0.0, max_y=1.0)
+    coordinates = coordinate_system.to_unstructured_coordinate()
+
+    for polygon in (Circle(position=(0.05, 0.02), radius=1.0), Polygon(coordinates=[(-1, -1), (0.5, -1), (0.5, 0.5), (-1, 0.5)])):
+        expected = polygon.contains_points(coordinates).reshape(coordinate_system.shape)
+        assert np.array_equal(polygon.rasterize(coordinate_system).astype(bool), expected)
+
+
+def test_rasterized_mesh_is_float64(sample_polygon):
+    coordinate_system = CoordinateSystem(nx=21, ny=17, min_x=-1, max_x=2, min_y=-1, max_y=2)
+
+    mesh = sample_polygon.get_rasterized_mesh(coordinate_system)
+
+    assert mesh.dtype == np.float64
+    assert np.array_equal(mesh, sample_polygon.rasterize(coordinate_system))
+
+
+def test_square_boolean_operations_match_geos():
+    square = Square(position=(0, 0), length=2)
+    overlapping = Square(position=(1, 0.5), length=2)
+    stacked = Square(position=(0, 2), length=2)
+    disjoint = Square(position=(5, 5), length=1)
+
+    for other in (overlapping, stacked, disjoint):
+        union = square.union(other)
+        assert union._shapely_object.equals(shapely.union(square._shapely_object, other._shapely_object))
+        assert (square + other)._shapely_object.equals(union._shapely_object)
+
+        intersection = square.intersection(other)
+        assert intersection._shapely_object.equals(shapely.intersection(square._shapely_object, other._shapely_object))
+        assert (square & other)._shapely_object.equals(intersection._shapely_object)
+
+    rotated = square.rotate(angle=30)
+    points = np.random.default_rng(0).uniform(-2, 2, size=(2000, 2))
+    for shape in (square, rotated):
+        expected = shapely.contains_xy(shape._shapely_object, points[:, 0], points[:, 1])
+        assert np.array_equal(shape.contains_points(points), expected)
+
+
+def test_primitive_rasterization_matches_polygon():
+    coordinate_system = CoordinateSystem(nx=201, ny=181, min_x=-3.1, max_x=3.3, min_y=-2.9, max_y=3.4)
+    shapes = [
+        Circle(position=(0.3, -0.2), radius=1.7),
+        Ellipse(position=(0.3, 1.0), radius=1.5, ratio=0.5, resolution=1024),
+        Square(position=(0.3, -0.2), length=2.1),
+        Circle(position=(0, 0), radius=1.0).translate(shift=(1, 0)),
+        Square(position=(0, 0), length=2.0).rotate(angle=30),
+    ]
+
+    for shape in shapes:
+        raster = shape.rasterize(coordinate_system)
+        assert np.array_equal(raster, Polygon.rasterize(shape, coordinate_system))
+        assert shape.get_rasterized_mesh(coordinate_system).dtype == np.float64
+
+
+def test_primitive_rasterization_matches_contains_points():
+    coordinate_system = CoordinateSystem(nx=203, ny=197, min_x=-2.03, max_x=2.11, min_y=-1.97, max_y=2.07)
+    coordinates = coordinate_system.to_unstructured_coordinate()
+
+    # A coarse resolution makes the polygon clearly differ from the exact conic near the boundary
+    for shape in (Circle(position=(0.1, -0.05), radius=1.7, resolution=4), Ellipse(position=(0.1, 0.4), radius=1.6, ratio=0.6, resolution=4)):
+        expected = shape.contains_points(coordinates).reshape(coordinate_system.shape)
+        assert np.array_equal(shape.rasterize(coordinate_system).astype(bool), expected)
+
+
+def test_circle_raster_cache():
+    circle = Circle(position=(0, 0), radius=1.0)
+    coordinate_system = CoordinateSystem(nx=51, ny=51, min_x=-2, max_x=2, min_y=-2, max_y=2)
+
+    mesh = circle.get_rasterized_mesh(coordinate_system)
+    mesh *= 2
+    assert circle.get_rasterized_mesh(coordinate_system).max() == 1
+
+    coordinate_system.update(min_x=0)
+    assert np.array_equal(circle.rasterize(coordinate_system), Circle(position=(0, 0), radius=1.0).rasterize(coordinate_system))
+
+
+def test_rasterize_polygons_matches_individual_rasters(sample_polygon, sample_multipolygon, coordinate_system):
+    polygons = [sample_polygon, Circle(position=(2, 2), radius=1.0), sample_multipolygon]
+
+    rasters = rasterize_polygons(polygons, coordinate_system, dtype=np.float64)
+
+    assert rasters.shape == (3, *coordinate_system.shape)
+    for polygon, raster in zip(polygons, rasters):
+        assert np.array_equal(raster, polygon.get_rasterized_mesh(coordinate_system))
+
+
+def test_precompile(monkeypatch, sample_polygon, coordinate_system):
+    rasterization.precompile()
+    expected = sample_polygon.rasterize(coordinate_system)
+
+    monkeypatch.setattr(rasterization, 'numba', None)
+    rasterization.precompile()
+
+    assert np.array_equal(sample_polygon.rasterize(coordinate_system), expected)
+
+
+def test_disable_numba_environment_variable(monkeypatch):
+    monkeypatch.setenv('FIBERFUSING_DISABLE_NUMBA', '1')
+    try:
+        assert importlib.reload(rasterization).numba is None
+    finally:
+        monkeypatch.undo()
+        importlib.reload(rasterization)
+
+
+def test_affine_operations_match_shapely_affinity(sample_polygon):
+    geometry = sample_polygon._shapely_object
+
+    assert sample_polygon.rotate(angle=90)._shapely_object.equals_exact(affinity.rotate(geometry, 90, origin=(0, 0)), 1e-12)
+    assert sample_polygon.rotate(angle=30, origin=(1, 2))._shapely_object.equals_exact(affinity.rotate(geometry, 30, origin=(1, 2)), 1e-12)
+    assert sample_polygon.scale(factor=3, origin=(0.5, 0.5))._shapely_object.equals_exact(affinity.scale(geometry, 3, 3, origin=(0.5, 0.5)), 1e-12)
+    assert sample_polygon.translate(shift=(1, -2))._shapely_object.equals_exact(affinity.translate(geometry, 1, -2), 1e-12)
+
+    polygons = [sample_polygon.copy(), Polygon(instance=geo.box(2, 2, 3, 4))]
+    transform_geometries(polygons, matrix=_rotate_matrix(45, 1, 1))
+
+    for polygon, original in zip(polygons, [geometry, geo.box(2, 2, 3, 4)]):
+        assert polygon._shapely_object.equals_exact(affinity.rotate(original, 45, origin=(1, 1)), 1e-12)
+
+    assert sample_polygon._shapely_object is geometry
+
+
+def test_union_and_intersection_of_several_geometries():
+    circles = [Polygon(instance=geo.Point(x, 0).buffer(1)) for x in (0, 1, 2)]
+    reference_union = circles[0]._shapely_object.union(circles[1]._shapely_object).union(circles[2]._shapely_object)
+    reference_intersection = circles[0]._shapely_object.intersection(circles[1]._shapely_object).intersection(circles[2]._shapely_object)
+
+    assert np.isclose(circles[0].union(*circles[1:]).area, reference_union.area)
+    assert np.isclose(circles[0].intersection(*circles[1:]).area, reference_intersection.area)
+    assert np.isclose(circles[0].union(circles[1]).area, circles[0]._shapely_object.union(circles[1]._shapely_object).area)
+
+
 if __name__ == "__main__":
     pytest.main(["-W error", __file__])